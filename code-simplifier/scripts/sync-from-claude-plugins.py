@@ -1,26 +1,85 @@
 #!/usr/bin/env python3
 
 import argparse
+import hashlib
+import json
 import sys
 from pathlib import Path
-from urllib.request import urlopen
+from urllib.error import HTTPError
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
 
 DEFAULT_REF = "main"
+AGENT_PATH = "plugins/code-simplifier/agents/code-simplifier.md"
 URL_TEMPLATE = (
     "https://raw.githubusercontent.com/anthropics/claude-plugins-official/"
-    "{ref}/plugins/code-simplifier/agents/code-simplifier.md"
+    "{ref}/" + AGENT_PATH
 )
+SKILL_DIR = Path(__file__).resolve().parents[1]
+# Validators and hashes from the last sync, so unchanged upstream costs one 304.
+# Local state per checkout: ignored by git (see .gitignore)
+MANIFEST_NAME = ".sync-manifest.json"
 
-def fetch_text(url: str) -> str:
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def resolve_source(source: str) -> str:
+    """Turn --url into something urlopen takes: http(s)/file URLs pass through,
+    a local file becomes a file:// URL and a local mirror of the plugins repo
+    resolves to its code-simplifier agent."""
+    if urlparse(source).scheme in ("http", "https", "file"):
+        return source
+    path = Path(source).expanduser().resolve()
+    if path.is_dir():
+        path = path / AGENT_PATH
+    if not path.is_file():
+        raise RuntimeError(f"Source not found: {path}")
+    return path.as_uri()
+
+
+def load_manifest(path: Path) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(path: Path, manifest: dict) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def fetch_text(url: str, etag: str = "", last_modified: str = ""):
+    """Download url, sending the cached validators; returns (text, etag,
+    last_modified), with text None when the server answers 304 Not Modified."""
+    request = Request(url)
+    if etag:
+        request.add_header("If-None-Match", etag)
+    if last_modified:
+        request.add_header("If-Modified-Since", last_modified)
     try:
-        with urlopen(url) as response:
+        with urlopen(request) as response:
             data = response.read()
+            headers = response.headers
+    except HTTPError as exc:
+        if exc.code == 304:
+            return None, etag, last_modified
+        raise RuntimeError(f"Failed to download {url}: {exc}") from exc
     except Exception as exc:
         raise RuntimeError(f"Failed to download {url}: {exc}") from exc
     try:
-        return data.decode("utf-8")
+        text = data.decode("utf-8")
     except UnicodeDecodeError as exc:
         raise RuntimeError("Downloaded content is not valid UTF-8") from exc
+    return text, headers.get("ETag", ""), headers.get("Last-Modified", "")
 
 
 def split_frontmatter(text: str):
@@ -51,35 +110,90 @@ def build_skill_text(name: str, description: str, body: str) -> str:
     return header + "# Code Simplifier\n\n" + body.rstrip() + "\n"
 
 
+def render_skill(text: str) -> str:
+    frontmatter, body = split_frontmatter(text)
+    name = frontmatter.get("name", "code-simplifier")
+    description = frontmatter.get(
+        "description",
+        "Simplifies and refines code for clarity, consistency, and maintainability "
+        "while preserving all functionality.",
+    )
+    if not body.strip():
+        raise RuntimeError("Downloaded content has no body")
+    return build_skill_text(name, description, body)
+
+
+def sync(url: str, skill_path: Path, manifest_path: Path, force: bool = False) -> bool:
+    """Bring skill_path up to date with url; returns False when nothing changed."""
+    manifest = {} if force else load_manifest(manifest_path)
+    try:
+        current = skill_path.read_text(encoding="utf-8")
+    except OSError:
+        current = None
+    # Validators only count while SKILL.md is still what the last sync wrote
+    cached = (
+        manifest.get("url") == url
+        and current is not None
+        and manifest.get("skill_sha256") == sha256_text(current)
+    )
+
+    text, etag, last_modified = fetch_text(
+        url,
+        manifest.get("etag", "") if cached else "",
+        manifest.get("last_modified", "") if cached else "",
+    )
+    if text is None:
+        return False
+
+    source_sha256 = sha256_text(text)
+    if cached and manifest.get("source_sha256") == source_sha256:
+        skill_text = current
+    else:
+        skill_text = render_skill(text)
+    changed = skill_text != current
+    if changed:
+        skill_path.write_text(skill_text, encoding="utf-8")
+
+    updated = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "source_sha256": source_sha256,
+        "skill_sha256": sha256_text(skill_text),
+    }
+    if updated != manifest:
+        # SKILL.md is already written; without a manifest the next sync just downloads in full
+        try:
+            save_manifest(manifest_path, updated)
+        except OSError as exc:
+            print(f"Warning: could not save {manifest_path}: {exc}", file=sys.stderr)
+    return changed
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Sync code-simplifier from anthropics/claude-plugins-official"
     )
     parser.add_argument("--ref", default=DEFAULT_REF, help="Git ref, default: main")
-    parser.add_argument("--url", default="", help="Override raw URL")
+    parser.add_argument(
+        "--url",
+        default="",
+        help="Override source: raw URL, file:// URL, local file or local mirror of the plugins repo",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help=f"Ignore {MANIFEST_NAME} and download unconditionally"
+    )
     args = parser.parse_args()
 
-    url = args.url or URL_TEMPLATE.format(ref=args.ref)
-
+    skill_path = SKILL_DIR / "SKILL.md"
     try:
-        text = fetch_text(url)
-        frontmatter, body = split_frontmatter(text)
-        name = frontmatter.get("name", "code-simplifier")
-        description = frontmatter.get(
-            "description",
-            "Simplifies and refines code for clarity, consistency, and maintainability "
-            "while preserving all functionality.",
-        )
-        if not body.strip():
-            raise RuntimeError("Downloaded content has no body")
-        skill_text = build_skill_text(name, description, body)
-        skill_path = Path(__file__).resolve().parents[1] / "SKILL.md"
-        skill_path.write_text(skill_text, encoding="utf-8")
+        url = resolve_source(args.url) if args.url else URL_TEMPLATE.format(ref=args.ref)
+        changed = sync(url, skill_path, SKILL_DIR / MANIFEST_NAME, args.force)
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
-    print(f"Updated {skill_path}")
+    print(f"{'Updated' if changed else 'Unchanged'} {skill_path}")
     return 0
 
 
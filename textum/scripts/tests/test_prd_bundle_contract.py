@@ -7,6 +7,9 @@ import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
+from textum.prd.prd_pack_scan import scan_json
+from textum.prd.prd_slices_types import SliceBudget
+from textum.prd.prd_slices_utils import chunk_list, measure_json
 from textum.textum_cli import main as textum_main
 
 
@@ -24,6 +27,19 @@ def _write_prd_pack(workspace: Path, prd_pack: dict) -> None:
     (docs_dir / "prd-pack.json").write_text(json.dumps(prd_pack, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
+def _greedy_chunks(items: list, build_obj, budget: SliceBudget) -> list[dict]:
+    """Largest runs of items whose fully serialized part fits the budget."""
+    parts: list[dict] = []
+    current: list = []
+    for item in items:
+        lines, chars = measure_json(build_obj(current + [item]))
+        if current and (lines > budget.max_lines or chars > budget.max_chars):
+            parts.append(build_obj(current))
+            current = []
+        current.append(item)
+    return parts + [build_obj(current)]
+
+
 def _minimal_valid_prd_pack() -> dict:
     return {
         "schema_version": "prd-pack@v1",
@@ -115,3 +131,145 @@ class TestPrdBundleContract(unittest.TestCase):
             self.assertEqual(out.strip().split("\n")[-1], "next: Scaffold Plan", msg=out)
             self.assertTrue((workspace / "docs" / "prd-slices" / "index.json").exists())
 
+    def test_prd_patch_never_reuses_deleted_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            prd_pack = _minimal_valid_prd_pack()
+            prd_pack["business_rules"] = [
+                {"id": None, "desc": f"Rule {i}", "scope": "global", "exception_or_note": None} for i in range(3)
+            ]
+            _write_prd_pack(workspace, prd_pack)
+            pack_path = workspace / "docs" / "prd-pack.json"
+
+            def rule_ids() -> list[str]:
+                return [rule["id"] for rule in json.loads(pack_path.read_text(encoding="utf-8"))["business_rules"]]
+
+            code, out, err = _run_textum(["prd", "check", "--workspace", str(workspace)])
+            self.assertEqual(code, 0, msg=out + err)
+            self.assertEqual(rule_ids(), ["BR-001", "BR-002", "BR-003"])
+
+            code, out, err = _run_textum(
+                ["prd", "patch", "delete", "--workspace", str(workspace), "--path", "$.business_rules[2]"]
+            )
+            self.assertEqual(code, 0, msg=out + err)
+            new_rule = {"id": None, "desc": "Rule 4", "scope": "global", "exception_or_note": None}
+            code, out, err = _run_textum(
+                [
+                    "prd",
+                    "patch",
+                    "append",
+                    "--workspace",
+                    str(workspace),
+                    "--path",
+                    "$.business_rules",
+                    "--value-json",
+                    json.dumps(new_rule),
+                ]
+            )
+            self.assertEqual(code, 0, msg=out + err)
+            self.assertEqual(rule_ids(), ["BR-001", "BR-002", "BR-004"])
+
+    def test_unreadable_id_ledger_prints_fix_list(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            _write_prd_pack(workspace, _minimal_valid_prd_pack())
+            # A directory where the ledger file should be: reading it raises an OSError
+            (workspace / "docs" / "prd-id-ledger.json").mkdir()
+
+            for argv in (
+                ["prd", "check", "--workspace", str(workspace)],
+                ["prd", "patch", "set", "--workspace", str(workspace), "--path", "$.project.name", "--value", "Renamed"],
+            ):
+                code, out, err = _run_textum(argv)
+                self.assertEqual(code, 1, msg=out + err)
+                lines = [line for line in out.strip().split("\n") if line.strip()]
+                self.assertEqual(lines[0], "FAIL", msg=out)
+                self.assertTrue(any("prd-id-ledger.json" in line and "cannot read ID ledger" in line for line in lines), msg=out)
+
+    def test_prd_slice_rerun_leaves_unchanged_slices_untouched(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            _write_prd_pack(workspace, _minimal_valid_prd_pack())
+            slices_dir = workspace / "docs" / "prd-slices"
+
+            code, out, err = _run_textum(["prd", "slice", "--workspace", str(workspace)])
+            self.assertEqual(code, 0, msg=out + err)
+            mtimes = {path.name: path.stat().st_mtime_ns for path in slices_dir.iterdir()}
+
+            stale_path = slices_dir / "roles.part-002.json"
+            stale_path.write_text("{}\n", encoding="utf-8")
+            code, out, err = _run_textum(["prd", "slice", "--workspace", str(workspace)])
+            self.assertEqual(code, 0, msg=out + err)
+            self.assertFalse(stale_path.exists())
+            self.assertEqual({path.name: path.stat().st_mtime_ns for path in slices_dir.iterdir()}, mtimes)
+
+            code, out, err = _run_textum(["prd", "slice", "--workspace", str(workspace)])
+            self.assertEqual(code, 0, msg=out + err)
+            self.assertEqual({path.name: path.stat().st_mtime_ns for path in slices_dir.iterdir()}, mtimes)
+
+    def test_prd_slice_pack_edit_rewrites_only_changed_parts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            prd_pack = _minimal_valid_prd_pack()
+            _write_prd_pack(workspace, prd_pack)
+            slices_dir = workspace / "docs" / "prd-slices"
+            index_path = slices_dir / "index.json"
+
+            code, out, err = _run_textum(["prd", "slice", "--workspace", str(workspace)])
+            self.assertEqual(code, 0, msg=out + err)
+            index_obj = json.loads(index_path.read_text(encoding="utf-8"))
+            self.assertEqual(index_obj["schema_version"], "prd-slices-index@v2")
+            self.assertNotIn("prd_pack_sha256", json.loads((slices_dir / "roles.json").read_text(encoding="utf-8"))["source"])
+
+            # An index written before v2 is regenerated, without touching parts whose content is unchanged
+            del index_obj["parts_sha256"]
+            index_obj["schema_version"] = "prd-slices-index@v1"
+            index_path.write_text(json.dumps(index_obj, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            mtimes = {path.name: path.stat().st_mtime_ns for path in slices_dir.iterdir() if path != index_path}
+            code, out, err = _run_textum(["prd", "slice", "--workspace", str(workspace)])
+            self.assertEqual(code, 0, msg=out + err)
+            self.assertEqual(json.loads(index_path.read_text(encoding="utf-8"))["schema_version"], "prd-slices-index@v2")
+            self.assertEqual({path.name: path.stat().st_mtime_ns for path in slices_dir.iterdir() if path != index_path}, mtimes)
+
+            prd_pack = json.loads((workspace / "docs" / "prd-pack.json").read_text(encoding="utf-8"))
+            prd_pack["goals"].append("Keep slices stable.")
+            _write_prd_pack(workspace, prd_pack)
+            code, out, err = _run_textum(["prd", "slice", "--workspace", str(workspace)])
+            self.assertEqual(code, 0, msg=out + err)
+            changed = {path.name for path in slices_dir.iterdir() if path.stat().st_mtime_ns != mtimes.get(path.name)}
+            self.assertEqual(changed, {"overview.json", "index.json"})
+
+    def test_chunk_list_matches_full_serialization(self) -> None:
+        items = [
+            {"id": f"BR-{i:03d}", "desc": "规则 " * (i % 7) + "x" * (i * 13 % 90), "tags": ["a"] * (i % 4), "note": None}
+            for i in range(60)
+        ]
+        builders = [
+            lambda part: {"schema_version": "v1", "source": {"sha256": "0" * 64}, "business_rules": part},
+            lambda part: {"schema_version": "v1", "data_model": {"tables": part}},
+            # Adds more than the list itself
+            lambda part: {"schema_version": "v1", "count": len(part) * 1000, "nfr": part},
+        ]
+        for build_obj in builders:
+            for budget in (SliceBudget(40, 1500), SliceBudget(120, 4000), SliceBudget(10_000, 1_000_000)):
+                actual = chunk_list(items, build_obj, budget=budget, loc="$.x", item_label="item")
+                self.assertEqual(actual, (_greedy_chunks(items, build_obj, budget), []))
+
+        parts, failures = chunk_list(items, builders[0], budget=SliceBudget(5, 100), loc="$.x", item_label="item")
+        self.assertEqual(parts, [])
+        self.assertEqual(failures[0].loc, "$.x[0]")
+
+    def test_scan_json_reports_match_paths(self) -> None:
+        scan = scan_json(
+            {
+                "id": "说明",
+                "modules": [{"name": " tbd "}, {"notes": ["ok", "see [...]", "<<FILL>> ```"]}],
+                "title": "中文标题",
+            },
+            count_scripts=True,
+        )
+        self.assertEqual(scan.todo_paths, ["$.modules[0].name=TBD"])
+        self.assertEqual(scan.ellipsis_paths, ["$.modules[1].notes[1]"])
+        self.assertEqual(scan.placeholder_paths, ["$.modules[1].notes[2]"])
+        self.assertEqual(scan.fence_paths, ["$.modules[1].notes[2]"])
+        self.assertEqual((scan.cjk, scan.latin), (4, 12))
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import json
 import tempfile
 import unittest
+from collections import Counter
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from unittest import mock
 
 from textum.textum_cli import main as textum_main
 
@@ -108,3 +111,43 @@ class TestStoryBundleContract(unittest.TestCase):
             self.assertEqual(out.strip().split("\n")[-1], "next: Story Exec", msg=out)
             self.assertTrue((workspace / "docs" / "story-exec").exists())
 
+    def test_story_pack_reads_each_pack_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            _write_json(workspace / "docs" / "prd-pack.json", _minimal_valid_prd_pack())
+            _write_json(workspace / "docs" / "scaffold-pack.json", _minimal_scaffold_pack_decisions_only())
+            _write_json(workspace / "docs" / "split-plan-pack.json", _minimal_split_plan_pack())
+            code, _, err = _run_textum(["split", "generate", "--workspace", str(workspace)])
+            self.assertEqual(code, 0, msg=err)
+
+            reads: Counter[str] = Counter()
+            read_bytes = Path.read_bytes
+            read_text = Path.read_text
+
+            def counting_read_bytes(path: Path) -> bytes:
+                reads[path.name] += 1
+                return read_bytes(path)
+
+            def counting_read_text(path: Path, *args, **kwargs) -> str:
+                reads[path.name] += 1
+                return read_text(path, *args, **kwargs)
+
+            with mock.patch.object(Path, "read_bytes", counting_read_bytes), mock.patch.object(
+                Path, "read_text", counting_read_text
+            ):
+                code, out, err = _run_textum(["story", "pack", "--workspace", str(workspace), "--n", "1"])
+            self.assertEqual(code, 0, msg=out + err)
+            self.assertEqual(reads["prd-pack.json"], 1)
+            self.assertEqual(reads["scaffold-pack.json"], 1)
+            story_sources = list((workspace / "docs" / "stories").glob("*.json"))
+            self.assertEqual(len(story_sources), 1)
+            self.assertEqual(reads[story_sources[0].name], 1)
+
+            (index_path,) = (workspace / "docs" / "story-exec").glob("*/index.json")
+            source = json.loads(index_path.read_text(encoding="utf-8"))["source"]
+            for key, path in (
+                ("prd_pack_sha256", workspace / "docs" / "prd-pack.json"),
+                ("scaffold_pack_sha256", workspace / "docs" / "scaffold-pack.json"),
+                ("story_source_sha256", story_sources[0]),
+            ):
+                self.assertEqual(source[key], hashlib.sha256(path.read_bytes()).hexdigest(), msg=key)
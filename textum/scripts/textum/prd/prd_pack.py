@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from .prd_pack_ids import normalize_prd_pack
-from .prd_pack_io import init_prd_pack, read_prd_pack, write_prd_pack
+from .prd_pack_ids import normalize_prd_pack, record_prd_ids
+from .prd_pack_io import (
+    init_prd_pack,
+    parse_prd_pack,
+    prd_id_ledger_path,
+    read_prd_id_ledger,
+    read_prd_pack,
+    write_prd_id_ledger,
+    write_prd_pack,
+)
 from .prd_pack_paths import skill_asset_paths, workspace_paths
-from .prd_pack_placeholders import collect_placeholders, iter_json_paths
+from .prd_pack_placeholders import collect_placeholders
 from .prd_pack_types import (
     API_ID_RE,
     BR_ID_RE,
@@ -38,12 +46,16 @@ __all__ = [
     "check_prd_pack",
     "collect_placeholders",
     "init_prd_pack",
-    "iter_json_paths",
     "normalize_prd_pack",
+    "parse_prd_pack",
+    "prd_id_ledger_path",
+    "read_prd_id_ledger",
     "read_prd_pack",
+    "record_prd_ids",
     "skill_asset_paths",
     "validate_prd_pack",
     "workspace_paths",
+    "write_prd_id_ledger",
     "write_prd_pack",
 ]
 
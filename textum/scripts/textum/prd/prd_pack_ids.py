@@ -25,13 +25,13 @@ def _format_seq_id(prefix: str, number: int, width: int) -> str:
     return f"{prefix}-{number:0{width}d}"
 
 
-def _next_id(pattern: re.Pattern[str], existing_ids: Iterable[str], prefix: str, width: int) -> str:
+def _max_id_number(pattern: re.Pattern[str], existing_ids: Iterable[str]) -> int:
     max_number = 0
     for existing_id in existing_ids:
         number = _extract_id_number(pattern, existing_id)
         if number is not None:
             max_number = max(max_number, number)
-    return _format_seq_id(prefix, max_number + 1, width)
+    return max_number
 
 
 def _assign_seq_ids(
@@ -42,6 +42,7 @@ def _assign_seq_ids(
     prefix: str,
     width: int,
     loc_prefix: str,
+    id_ledger: dict[str, int] | None = None,
 ) -> tuple[bool, list[Failure]]:
     failures: list[Failure] = []
     modified = False
@@ -91,31 +92,29 @@ def _assign_seq_ids(
     if failures:
         return False, failures
 
-    next_value = _next_id(pattern, existing_ids, prefix, width)
+    # New IDs continue past both the pack and the ledger, so deleted IDs are never handed out again
+    next_number = _max_id_number(pattern, existing_ids) + 1
+    if id_ledger is not None:
+        next_number = max(next_number, id_ledger.get(prefix, 0) + 1)
     for item in items:
         raw_id = item.get(id_field)
         if raw_id is None or (isinstance(raw_id, str) and raw_id.strip() == ""):
-            item[id_field] = next_value
+            item[id_field] = _format_seq_id(prefix, next_number, width)
             modified = True
-            existing_ids.append(next_value)
-            next_value = _next_id(pattern, existing_ids, prefix, width)
+            next_number += 1
+    if id_ledger is not None:
+        id_ledger[prefix] = next_number - 1
 
     return modified, []
 
 
-def normalize_prd_pack(prd_pack: dict[str, Any]) -> tuple[bool, list[Failure]]:
-    failures: list[Failure] = []
-    modified = False
+def _id_groups(prd_pack: dict[str, Any]) -> list[tuple[list[dict[str, Any]], re.Pattern[str], str, int, str]]:
+    """(items, pattern, prefix, width, loc_prefix) for every ID-carrying list in the pack."""
+    groups: list[tuple[list[dict[str, Any]], re.Pattern[str], str, int, str]] = []
 
     modules_value = prd_pack.get("modules")
     if isinstance(modules_value, list):
         modules = [m for m in modules_value if isinstance(m, dict)]
-        changed, id_failures = _assign_seq_ids(
-            modules, id_field="id", pattern=MODULE_ID_RE, prefix="M", width=2, loc_prefix="$.modules"
-        )
-        modified = modified or changed
-        failures.extend(id_failures)
-
         feature_points: list[dict[str, Any]] = []
         scenarios: list[dict[str, Any]] = []
         for module in modules:
@@ -125,59 +124,59 @@ def normalize_prd_pack(prd_pack: dict[str, Any]) -> tuple[bool, list[Failure]]:
             scs = module.get("scenarios")
             if isinstance(scs, list):
                 scenarios.extend([sc for sc in scs if isinstance(sc, dict)])
-
-        changed, id_failures = _assign_seq_ids(
-            feature_points,
-            id_field="id",
-            pattern=FP_ID_RE,
-            prefix="FP",
-            width=3,
-            loc_prefix="$.modules[].feature_points",
-        )
-        modified = modified or changed
-        failures.extend(id_failures)
-
-        changed, id_failures = _assign_seq_ids(
-            scenarios, id_field="id", pattern=SC_ID_RE, prefix="SC", width=2, loc_prefix="$.modules[].scenarios"
-        )
-        modified = modified or changed
-        failures.extend(id_failures)
+        groups.append((modules, MODULE_ID_RE, "M", 2, "$.modules"))
+        groups.append((feature_points, FP_ID_RE, "FP", 3, "$.modules[].feature_points"))
+        groups.append((scenarios, SC_ID_RE, "SC", 2, "$.modules[].scenarios"))
 
     rules_value = prd_pack.get("business_rules")
     if isinstance(rules_value, list):
         rules = [rule for rule in rules_value if isinstance(rule, dict)]
-        changed, id_failures = _assign_seq_ids(
-            rules, id_field="id", pattern=BR_ID_RE, prefix="BR", width=3, loc_prefix="$.business_rules"
-        )
-        modified = modified or changed
-        failures.extend(id_failures)
+        groups.append((rules, BR_ID_RE, "BR", 3, "$.business_rules"))
 
     data_model = prd_pack.get("data_model")
     if isinstance(data_model, dict):
         tables_value = data_model.get("tables")
         if isinstance(tables_value, list):
             tables = [table for table in tables_value if isinstance(table, dict)]
-            changed, id_failures = _assign_seq_ids(
-                tables,
-                id_field="id",
-                pattern=TBL_ID_RE,
-                prefix="TBL",
-                width=3,
-                loc_prefix="$.data_model.tables",
-            )
-            modified = modified or changed
-            failures.extend(id_failures)
+            groups.append((tables, TBL_ID_RE, "TBL", 3, "$.data_model.tables"))
 
     api = prd_pack.get("api")
     if isinstance(api, dict):
         endpoints_value = api.get("endpoints")
         if isinstance(endpoints_value, list):
             endpoints = [endpoint for endpoint in endpoints_value if isinstance(endpoint, dict)]
-            changed, id_failures = _assign_seq_ids(
-                endpoints, id_field="id", pattern=API_ID_RE, prefix="API", width=3, loc_prefix="$.api.endpoints"
-            )
-            modified = modified or changed
-            failures.extend(id_failures)
+            groups.append((endpoints, API_ID_RE, "API", 3, "$.api.endpoints"))
+
+    return groups
+
+
+def normalize_prd_pack(
+    prd_pack: dict[str, Any], *, id_ledger: dict[str, int] | None = None
+) -> tuple[bool, list[Failure]]:
+    """Assign missing IDs in place; id_ledger (prefix -> highest number ever used) is read and advanced."""
+    failures: list[Failure] = []
+    modified = False
+
+    for items, pattern, prefix, width, loc_prefix in _id_groups(prd_pack):
+        changed, id_failures = _assign_seq_ids(
+            items,
+            id_field="id",
+            pattern=pattern,
+            prefix=prefix,
+            width=width,
+            loc_prefix=loc_prefix,
+            id_ledger=id_ledger,
+        )
+        modified = modified or changed
+        failures.extend(id_failures)
 
     return modified, failures
 
+
+def record_prd_ids(prd_pack: dict[str, Any], id_ledger: dict[str, int]) -> None:
+    """Raise id_ledger to the IDs already in prd_pack, before an edit can delete them."""
+    for items, pattern, prefix, _, _ in _id_groups(prd_pack):
+        ids = [item["id"] for item in items if isinstance(item.get("id"), str)]
+        max_number = _max_id_number(pattern, ids)
+        if max_number > id_ledger.get(prefix, 0):
+            id_ledger[prefix] = max_number
@@ -4,7 +4,9 @@ import json
 from pathlib import Path
 from typing import Any
 
-from .prd_pack_types import Failure, PRD_TEMPLATE_FILENAME
+from .prd_pack_types import Failure, PRD_ID_LEDGER_FILENAME, PRD_TEMPLATE_FILENAME
+
+PRD_ID_LEDGER_SCHEMA_VERSION = "prd-id-ledger@v1"
 
 
 def ensure_dir(path: Path) -> None:
@@ -12,7 +14,12 @@ def ensure_dir(path: Path) -> None:
 
 
 def read_prd_pack(path: Path) -> tuple[dict[str, Any] | None, list[Failure]]:
-    if not path.exists():
+    return parse_prd_pack(path, path.read_bytes() if path.exists() else None)
+
+
+def parse_prd_pack(path: Path, raw: bytes | None) -> tuple[dict[str, Any] | None, list[Failure]]:
+    """Parse the bytes already read from path; None means the file does not exist."""
+    if raw is None:
         return None, [
             Failure(
                 loc=str(path),
@@ -23,7 +30,7 @@ def read_prd_pack(path: Path) -> tuple[dict[str, Any] | None, list[Failure]]:
             )
         ]
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(raw.decode("utf-8"))
     except json.JSONDecodeError as error:
         loc_hint = f"line {error.lineno} col {error.colno}"
         return None, [
@@ -48,9 +55,51 @@ def read_prd_pack(path: Path) -> tuple[dict[str, Any] | None, list[Failure]]:
     return data, []
 
 
-def write_prd_pack(path: Path, prd_pack: dict[str, Any]) -> None:
+def write_prd_pack(path: Path, prd_pack: dict[str, Any]) -> str:
+    ensure_dir(path.parent)
+    text = json.dumps(prd_pack, ensure_ascii=False, indent=2) + "\n"
+    path.write_text(text, encoding="utf-8")
+    return text
+
+
+def prd_id_ledger_path(prd_pack_path: Path) -> Path:
+    return prd_pack_path.with_name(PRD_ID_LEDGER_FILENAME)
+
+
+def read_prd_id_ledger(path: Path) -> tuple[dict[str, int], list[Failure]]:
+    """High-water marks per ID prefix; a missing or malformed ledger starts empty.
+
+    A ledger that exists but cannot be read (permissions, a directory in its
+    place) is a failure: starting empty could reassign IDs it recorded.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, UnicodeDecodeError, json.JSONDecodeError):
+        return {}, []
+    except OSError as error:
+        return {}, [
+            Failure(
+                loc=str(path),
+                problem=f"cannot read ID ledger: {error.strerror or error}",
+                expected="readable JSON file",
+                impact="cannot assign IDs without reusing deleted ones",
+                fix=f"fix permissions of {path.as_posix()} or remove it",
+            )
+        ]
+    high_water = data.get("high_water") if isinstance(data, dict) else None
+    if not isinstance(high_water, dict):
+        return {}, []
+    return {
+        prefix: number
+        for prefix, number in high_water.items()
+        if isinstance(number, int) and not isinstance(number, bool) and number >= 0
+    }, []
+
+
+def write_prd_id_ledger(path: Path, ledger: dict[str, int]) -> None:
     ensure_dir(path.parent)
-    path.write_text(json.dumps(prd_pack, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    data = {"schema_version": PRD_ID_LEDGER_SCHEMA_VERSION, "high_water": dict(sorted(ledger.items()))}
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
 def init_prd_pack(template_path: Path, out_path: Path, *, force: bool) -> tuple[bool, list[Failure]]:
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import Any
 
+# (api_by_id, tbl_by_id, fp_ids, br_by_id)
+PrdMaps = tuple[dict[str, Any], dict[str, Any], set[str], dict[str, Any]]
 
-def build_prd_maps(
-    prd_pack: dict[str, Any],
-) -> tuple[dict[str, Any], dict[str, Any], set[str], dict[str, Any]]:
+
+def build_prd_maps(prd_pack: dict[str, Any]) -> PrdMaps:
     api_endpoints = prd_pack.get("api", {}).get("endpoints", [])
     api_by_id: dict[str, Any] = {}
     if isinstance(api_endpoints, list):
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from .prd_pack_types import (
+    PRD_ID_LEDGER_FILENAME,
     PRD_PACK_FILENAME,
     PRD_RENDER_FILENAME,
     PRD_SCHEMA_FILENAME,
@@ -25,6 +26,7 @@ def workspace_paths(workspace: Path) -> dict[str, Path]:
     return {
         "docs_dir": docs_dir,
         "prd_pack": docs_dir / PRD_PACK_FILENAME,
+        "prd_id_ledger": docs_dir / PRD_ID_LEDGER_FILENAME,
         "prd_render": docs_dir / PRD_RENDER_FILENAME,
         "prd_slices_dir": prd_slices_dir,
         "prd_slices_index": prd_slices_dir / "index.json",
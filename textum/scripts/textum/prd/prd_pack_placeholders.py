@@ -1,20 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any
 
+from .prd_pack_scan import scan_json
 from .prd_pack_types import Failure, PLACEHOLDER_SENTINEL
 
 
-def iter_json_paths(value: Any, path: str = "$") -> Iterable[tuple[str, Any]]:
-    yield path, value
-    if isinstance(value, dict):
-        for key, child in value.items():
-            yield from iter_json_paths(child, f"{path}.{key}")
-    elif isinstance(value, list):
-        for index, child in enumerate(value):
-            yield from iter_json_paths(child, f"{path}[{index}]")
-
-
 def _examples_summary(examples: list[str], *, limit: int = 8) -> str:
     if len(examples) <= limit:
         return ", ".join(examples)
@@ -24,15 +15,9 @@ def _examples_summary(examples: list[str], *, limit: int = 8) -> str:
 
 
 def collect_placeholders(prd_pack: dict[str, Any]) -> list[Failure]:
-    placeholder_paths: list[str] = []
-    fence_paths: list[str] = []
-    for path, value in iter_json_paths(prd_pack):
-        if not isinstance(value, str):
-            continue
-        if PLACEHOLDER_SENTINEL in value:
-            placeholder_paths.append(path)
-        if "```" in value:
-            fence_paths.append(path)
+    scan = scan_json(prd_pack)
+    placeholder_paths = scan.placeholder_paths
+    fence_paths = scan.fence_paths
 
     failures: list[Failure] = []
     if placeholder_paths:
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import re
+import string
+from dataclasses import dataclass, field
+from typing import Any
+
+from .prd_pack_types import PLACEHOLDER_SENTINEL
+
+_CJK_RE = re.compile(r"[\u4e00-\u9fff\u3400-\u4dbf]")
+_DROP_LATIN = str.maketrans("", "", string.ascii_letters)
+
+# Where a node sits: (parent location, parent container, key or index); None is the root "$".
+# Cheap to create per node; turned into a "$.a[0].b" string only for the nodes that match.
+_Location = tuple[Any, Any, Any] | None
+
+
+@dataclass
+class JsonScan:
+    placeholder_paths: list[str] = field(default_factory=list)
+    fence_paths: list[str] = field(default_factory=list)
+    todo_paths: list[str] = field(default_factory=list)
+    ellipsis_paths: list[str] = field(default_factory=list)
+    cjk: int = 0
+    latin: int = 0
+
+
+def json_path(location: _Location) -> str:
+    segments: list[str] = []
+    while location is not None:
+        location, container, key = location
+        segments.append(f"[{key}]" if isinstance(container, list) else f".{key}")
+    return "$" + "".join(reversed(segments))
+
+
+def scan_json(value: Any, *, count_scripts: bool = False) -> JsonScan:
+    """Check every string in value in one iterative pass.
+
+    Collects the paths holding the placeholder sentinel, ``` fences, a bare
+    TBD/TODO ("path=TBD") or [...]; with count_scripts, also counts CJK and
+    Latin letters outside "id" fields (for language detection).
+    """
+    scan = JsonScan()
+    stack: list[tuple[Any, _Location, bool]] = [(value, None, False)]
+    while stack:
+        node, location, in_id = stack.pop()
+        if isinstance(node, str):
+            if PLACEHOLDER_SENTINEL in node:
+                scan.placeholder_paths.append(json_path(location))
+            if "```" in node:
+                scan.fence_paths.append(json_path(location))
+            stripped = node.strip()
+            # Upper-casing never shortens a string, so only short ones can read TBD/TODO
+            if len(stripped) <= 4 and stripped.upper() in ("TBD", "TODO"):
+                scan.todo_paths.append(f"{json_path(location)}={stripped.upper()}")
+            if "[...]" in node:
+                scan.ellipsis_paths.append(json_path(location))
+            if count_scripts and not in_id:
+                scan.latin += len(node) - len(node.translate(_DROP_LATIN))
+                if not node.isascii():
+                    scan.cjk += len(_CJK_RE.findall(node))
+        elif isinstance(node, dict):
+            children = [
+                (child, (location, node, key), in_id or (count_scripts and isinstance(key, str) and key.lower() == "id"))
+                for key, child in node.items()
+            ]
+            children.reverse()
+            stack.extend(children)
+        elif isinstance(node, list):
+            stack.extend((node[index], (location, node, index), in_id) for index in range(len(node) - 1, -1, -1))
+    return scan
+
@@ -8,6 +8,7 @@ PRD_PACK_FILENAME = "prd-pack.json"
 PRD_RENDER_FILENAME = "PRD.md"
 PRD_TEMPLATE_FILENAME = "prd-pack.template.json"
 PRD_SCHEMA_FILENAME = "prd-pack.schema.json"
+PRD_ID_LEDGER_FILENAME = "prd-id-ledger.json"
 
 PLACEHOLDER_SENTINEL = "<<FILL>>"
 
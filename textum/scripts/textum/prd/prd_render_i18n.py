@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 from typing import Any
 
+from .prd_pack_scan import scan_json
 from .prd_render_i18n_labels_en import LABELS_EN
 from .prd_render_i18n_labels_zh import LABELS_ZH
 
@@ -20,37 +21,9 @@ def resolve_render_lang(lang: str, prd_pack: dict[str, Any]) -> str:
 
 
 def detect_pack_lang(prd_pack: dict[str, Any]) -> str:
-    strings: list[str] = []
-
-    def walk(value: Any) -> None:
-        if value is None:
-            return
-        if isinstance(value, str):
-            strings.append(value)
-            return
-        if isinstance(value, dict):
-            for k, v in value.items():
-                if isinstance(k, str) and k.lower() == "id":
-                    continue
-                walk(v)
-            return
-        if isinstance(value, list):
-            for item in value:
-                walk(item)
-            return
-
-    walk(prd_pack)
-
-    cjk = 0
-    latin = 0
-    for text in strings:
-        for ch in text:
-            code = ord(ch)
-            if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF:
-                cjk += 1
-                continue
-            if ("A" <= ch <= "Z") or ("a" <= ch <= "z"):
-                latin += 1
+    scan = scan_json(prd_pack, count_scripts=True)
+    cjk = scan.cjk
+    latin = scan.latin
 
     if cjk == 0 and latin == 0:
         return "zh"
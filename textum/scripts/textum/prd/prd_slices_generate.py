@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import shutil
 from pathlib import Path
 from typing import Any
 
 from .prd_pack_types import Failure
-from .prd_slices_types import SliceBudget
-from .prd_slices_utils import json_text, rel_posix, sha256_file
+from .prd_slices_types import PRD_SLICES_INDEX_SCHEMA_VERSION, SliceBudget
+from .prd_slices_utils import json_text, parts_digest, rel_posix, sha256_file, sha256_text
 from .prd_slices_writer import SliceWriter
 from .prd_slices_generate_write_a import write_prd_slices_part_a
 from .prd_slices_generate_write_b import write_prd_slices_part_b
@@ -20,39 +21,98 @@ def generate_prd_slices(
     out_dir: Path,
     budget: SliceBudget,
     clean: bool,
+    prd_pack_sha256: str | None = None,
 ) -> tuple[list[Path], list[Failure]]:
-    if clean and out_dir.exists():
-        shutil.rmtree(out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
     workspace_root = prd_pack_path.parent.parent
 
-    if prd_pack_path.exists():
+    if prd_pack_sha256 is None and prd_pack_path.exists():
         prd_pack_sha256 = sha256_file(prd_pack_path)
-    else:
+    elif prd_pack_sha256 is None:
         prd_pack_sha256 = hashlib.sha256(json_text(prd_pack).encode("utf-8")).hexdigest()
 
-    source = {
+    # Parts leave out the pack hash so a pack edit only rewrites the parts whose content changed;
+    # index.json records it
+    part_source = {
         "prd_pack_path": rel_posix(prd_pack_path, workspace_root),
         "prd_pack_schema_version": prd_pack.get("schema_version"),
-        "prd_pack_sha256": prd_pack_sha256,
     }
+    source = {**part_source, "prd_pack_sha256": prd_pack_sha256}
+
+    index_path = out_dir / "index.json"
+    up_to_date = _unchanged_slices(index_path, source=source, budget=budget, workspace_root=workspace_root)
+    if up_to_date is not None:
+        return up_to_date, []
 
+    out_dir.mkdir(parents=True, exist_ok=True)
     writer = SliceWriter(out_dir=out_dir, budget=budget, workspace_root=workspace_root)
 
     overview = {
         "schema_version": "prd-slice-overview@v1",
-        "source": source,
+        "source": part_source,
         "project": prd_pack.get("project"),
         "goals": prd_pack.get("goals"),
         "non_goals": prd_pack.get("non_goals"),
         "scope": prd_pack.get("scope"),
     }
     writer.write_part("overview", "overview.json", overview)
-    write_prd_slices_part_a(writer=writer, source=source, prd_pack=prd_pack)
-    write_prd_slices_part_b(writer=writer, source=source, prd_pack=prd_pack)
+    write_prd_slices_part_a(writer=writer, source=part_source, prd_pack=prd_pack)
+    write_prd_slices_part_b(writer=writer, source=part_source, prd_pack=prd_pack)
 
     writer.write_index(source=source)
 
+    if clean:
+        _remove_stale(out_dir, keep=set(writer.produced))
+
     return writer.written, writer.failures
 
+
+def _remove_stale(out_dir: Path, *, keep: set[Path]) -> None:
+    for child in out_dir.iterdir():
+        if child in keep:
+            continue
+        if child.is_dir():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+
+
+def _unchanged_slices(
+    index_path: Path, *, source: dict[str, Any], budget: SliceBudget, workspace_root: Path
+) -> list[Path] | None:
+    """The slice files when index.json already describes this exact pack and
+    budget and the directory holds just those intact parts; otherwise None.
+
+    Over-budget parts stay on disk unlisted, so a previous failing run never
+    matches and gets regenerated (and reported) again. A v1 index has no
+    parts_sha256 to check the parts against, so it is regenerated too.
+    """
+    try:
+        index_text = index_path.read_text(encoding="utf-8")
+        index_obj = json.loads(index_text)
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+    if not isinstance(index_obj, dict) or index_obj.get("schema_version") != PRD_SLICES_INDEX_SCHEMA_VERSION:
+        return None
+    if index_obj.get("source") != source:
+        return None
+    if index_obj.get("budget") != {"max_lines": budget.max_lines, "max_chars": budget.max_chars}:
+        return None
+    if index_text.count("\n") > budget.max_lines or len(index_text) > budget.max_chars:
+        return None
+
+    parts = index_obj.get("parts")
+    if not isinstance(parts, list) or not all(isinstance(p, dict) and isinstance(p.get("path"), str) for p in parts):
+        return None
+    paths = [workspace_root / entry["path"] for entry in parts]
+    if {child for child in index_path.parent.iterdir()} != {*paths, index_path}:
+        return None
+    part_hashes: list[str] = []
+    for path in paths:
+        try:
+            part_hashes.append(sha256_text(path.read_text(encoding="utf-8")))
+        except (OSError, UnicodeDecodeError):
+            return None
+    if index_obj.get("parts_sha256") != parts_digest(parts, part_hashes):
+        return None
+    return [*paths, index_path]
+
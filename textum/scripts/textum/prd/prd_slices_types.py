@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+# v2: index.json records parts_sha256, and only the index carries source.prd_pack_sha256
+PRD_SLICES_INDEX_SCHEMA_VERSION = "prd-slices-index@v2"
+
 
 @dataclass(frozen=True)
 class SliceBudget:
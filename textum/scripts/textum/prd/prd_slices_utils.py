@@ -8,13 +8,15 @@ from typing import Any, Callable, Iterable
 from .prd_pack_types import Failure
 from .prd_slices_types import SliceBudget
 
+JSON_INDENT = 2
+
 
 def sha256_file(path: Path) -> str:
     return hashlib.sha256(path.read_bytes()).hexdigest()
 
 
 def json_text(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, indent=2) + "\n"
+    return json.dumps(obj, ensure_ascii=False, indent=JSON_INDENT) + "\n"
 
 
 def measure_json(obj: Any) -> tuple[int, int]:
@@ -29,6 +31,29 @@ def write_json(path: Path, obj: Any) -> tuple[int, int]:
     return (text.count("\n"), len(text))
 
 
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def parts_digest(parts: list[dict[str, Any]], part_hashes: list[str]) -> str:
+    """One hash over every part's path and content, recorded in index.json."""
+    digest = hashlib.sha256()
+    for entry, part_hash in zip(parts, part_hashes):
+        digest.update(f"{entry['path']}\0{part_hash}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
 def rel_posix(path: Path, workspace_root: Path) -> str:
     try:
         return path.relative_to(workspace_root).as_posix()
@@ -46,6 +71,36 @@ def id_range(ids: Iterable[str]) -> tuple[str | None, str | None]:
     return first, last
 
 
+def _nesting_depth(obj: Any, target: list[Any], depth: int = 0) -> int | None:
+    if obj is target:
+        return depth
+    children = obj.values() if isinstance(obj, dict) else obj if isinstance(obj, list) else ()
+    for child in children:
+        found = _nesting_depth(child, target, depth + 1)
+        if found is not None:
+            return found
+    return None
+
+
+def _list_layout(build_obj: Callable[[list[Any]], dict[str, Any]]) -> tuple[int, int, int] | None:
+    """(lines, chars, item indent) of the object around an empty chunked list, or
+    None when build_obj does not embed the list it is given."""
+    part_items: list[Any] = []
+    obj = build_obj(part_items)
+    depth = _nesting_depth(obj, part_items)
+    if depth is None:
+        return None
+    empty_lines, empty_chars = measure_json(obj)
+    # json_text indents each nesting level by JSON_INDENT; items sit one level inside the list
+    return empty_lines, empty_chars, JSON_INDENT * (depth + 1)
+
+
+def _measure_item(item: Any, indent: int) -> tuple[int, int]:
+    text = json.dumps(item, ensure_ascii=False, indent=JSON_INDENT)
+    lines = text.count("\n")
+    return (lines, len(text) + indent * (lines + 1))
+
+
 def chunk_list(
     items: list[Any],
     build_obj: Callable[[list[Any]], dict[str, Any]],
@@ -72,6 +127,68 @@ def chunk_list(
             )
         return [obj], []
 
+    # Size each item once and keep running totals. Every part is then measured in full once: a
+    # builder that adds more than the list (e.g. a count) falls back to measuring every candidate.
+    layout = _list_layout(build_obj)
+    if layout is None:
+        return _chunk_list_remeasured(items, build_obj, budget=budget, loc=loc, item_label=item_label)
+    base_lines, base_chars, indent = layout
+
+    parts: list[dict[str, Any]] = []
+    # Predicted (lines, chars) of each part
+    part_sizes: list[tuple[int, int]] = []
+    failures: list[Failure] = []
+    current: list[Any] = []
+    # Items serialized so far in current, as they appear inside the list
+    items_lines = 0
+    items_chars = 0
+    current_size = (base_lines, base_chars)
+
+    for index, item in enumerate(items):
+        item_lines, item_chars = _measure_item(item, indent)
+        # n items add "[\n", n - 1 ",\n" separators and "\n" + closing indent to the empty "[]"
+        count = len(current) + 1
+        lines = base_lines + items_lines + item_lines + count + 1
+        chars = base_chars + items_chars + item_chars + 2 * (count - 1) + indent
+
+        if lines <= budget.max_lines and chars <= budget.max_chars:
+            current.append(item)
+            items_lines += item_lines
+            items_chars += item_chars
+            current_size = (lines, chars)
+            continue
+
+        if len(current) == 0:
+            if measure_json(build_obj([item])) != (lines, chars):
+                return _chunk_list_remeasured(items, build_obj, budget=budget, loc=loc, item_label=item_label)
+            failures.append(_single_item_failure(build_obj, item, budget=budget, loc=f"{loc}[{index}]", item_label=item_label))
+            return [], failures
+
+        parts.append(build_obj(current))
+        part_sizes.append(current_size)
+        current = [item]
+        items_lines, items_chars = item_lines, item_chars
+        current_size = (base_lines + item_lines + 2, base_chars + item_chars + indent)
+
+    if current:
+        parts.append(build_obj(current))
+        part_sizes.append(current_size)
+
+    if any(measure_json(part) != size for part, size in zip(parts, part_sizes)):
+        return _chunk_list_remeasured(items, build_obj, budget=budget, loc=loc, item_label=item_label)
+    return parts, failures
+
+
+def _chunk_list_remeasured(
+    items: list[Any],
+    build_obj: Callable[[list[Any]], dict[str, Any]],
+    *,
+    budget: SliceBudget,
+    loc: str,
+    item_label: str,
+) -> tuple[list[dict[str, Any]], list[Failure]]:
+    """chunk_list for builders whose output is not a plain embedding of the list:
+    every candidate chunk is built and measured in full."""
     parts: list[dict[str, Any]] = []
     failures: list[Failure] = []
     current: list[Any] = []
@@ -86,17 +203,7 @@ def chunk_list(
             continue
 
         if len(current) == 0:
-            single_obj = build_obj([item])
-            single_lines, single_chars = measure_json(single_obj)
-            failures.append(
-                Failure(
-                    loc=f"{loc}[{index}]",
-                    problem=f"single {item_label} item exceeds budget: {single_lines} lines, {single_chars} chars",
-                    expected=f"<= {budget.max_lines} lines and <= {budget.max_chars} chars",
-                    impact="cannot auto-chunk this item further",
-                    fix="reduce this item content in docs/prd-pack.json",
-                )
-            )
+            failures.append(_single_item_failure(build_obj, item, budget=budget, loc=f"{loc}[{index}]", item_label=item_label))
             return [], failures
 
         parts.append(build_obj(current))
@@ -107,3 +214,20 @@ def chunk_list(
 
     return parts, failures
 
+
+def _single_item_failure(
+    build_obj: Callable[[list[Any]], dict[str, Any]],
+    item: Any,
+    *,
+    budget: SliceBudget,
+    loc: str,
+    item_label: str,
+) -> Failure:
+    single_lines, single_chars = measure_json(build_obj([item]))
+    return Failure(
+        loc=loc,
+        problem=f"single {item_label} item exceeds budget: {single_lines} lines, {single_chars} chars",
+        expected=f"<= {budget.max_lines} lines and <= {budget.max_chars} chars",
+        impact="cannot auto-chunk this item further",
+        fix="reduce this item content in docs/prd-pack.json",
+    )
@@ -5,8 +5,16 @@ from pathlib import Path
 from typing import Any, Callable
 
 from .prd_pack_types import Failure
-from .prd_slices_types import SliceBudget
-from .prd_slices_utils import chunk_list, id_range, rel_posix, write_json
+from .prd_slices_types import PRD_SLICES_INDEX_SCHEMA_VERSION, SliceBudget
+from .prd_slices_utils import (
+    chunk_list,
+    id_range,
+    json_text,
+    parts_digest,
+    rel_posix,
+    sha256_text,
+    write_text_if_changed,
+)
 
 
 @dataclass
@@ -15,12 +23,18 @@ class SliceWriter:
     budget: SliceBudget
     workspace_root: Path
     written: list[Path] = field(default_factory=list)
+    # Every file this run produced, including over-budget parts left for inspection
+    produced: list[Path] = field(default_factory=list)
     parts_index: list[dict[str, Any]] = field(default_factory=list)
     failures: list[Failure] = field(default_factory=list)
+    part_hashes: list[str] = field(default_factory=list)
 
     def write_part(self, kind: str, filename: str, obj: dict[str, Any], *, count: int | None = None) -> bool:
         path = self.out_dir / filename
-        lines, chars = write_json(path, obj)
+        text = json_text(obj)
+        lines, chars = text.count("\n"), len(text)
+        write_text_if_changed(path, text)
+        self.produced.append(path)
         if lines > self.budget.max_lines or chars > self.budget.max_chars:
             self.failures.append(
                 Failure(
@@ -43,6 +57,7 @@ class SliceWriter:
         if count is not None:
             entry["count"] = count
         self.parts_index.append(entry)
+        self.part_hashes.append(sha256_text(text))
         return True
 
     def write_chunked_parts(
@@ -71,13 +86,17 @@ class SliceWriter:
 
     def write_index(self, *, source: dict[str, Any]) -> None:
         index_obj = {
-            "schema_version": "prd-slices-index@v1",
+            "schema_version": PRD_SLICES_INDEX_SCHEMA_VERSION,
             "source": source,
             "budget": {"max_lines": self.budget.max_lines, "max_chars": self.budget.max_chars},
+            "parts_sha256": parts_digest(self.parts_index, self.part_hashes),
             "parts": self.parts_index,
         }
         index_path = self.out_dir / "index.json"
-        index_lines, index_chars = write_json(index_path, index_obj)
+        index_text = json_text(index_obj)
+        index_lines, index_chars = index_text.count("\n"), len(index_text)
+        write_text_if_changed(index_path, index_text)
+        self.produced.append(index_path)
         if index_lines > self.budget.max_lines or index_chars > self.budget.max_chars:
             self.failures.append(
                 Failure(
@@ -6,7 +6,7 @@ from typing import Any
 
 from textum.prd.prd_pack_types import Failure
 from .scaffold_pack_extract import extract_from_prd_pack
-from .scaffold_pack_io import init_scaffold_pack, read_scaffold_pack, write_scaffold_pack
+from .scaffold_pack_io import init_scaffold_pack, parse_scaffold_pack, read_scaffold_pack, write_scaffold_pack
 from .scaffold_pack_types import SCAFFOLD_PACK_FILENAME
 from .scaffold_pack_validate import check_scaffold_pack, validate_scaffold_pack
 
@@ -17,6 +17,7 @@ __all__ = [
     "extract_from_prd_pack",
     "init_scaffold_pack",
     "normalize_scaffold_pack",
+    "parse_scaffold_pack",
     "read_scaffold_pack",
     "validate_scaffold_pack",
     "write_scaffold_pack",
@@ -32,7 +33,11 @@ def normalize_scaffold_pack(
     *,
     prd_pack_path: Path,
     prd_pack: dict[str, Any],
+    prd_pack_sha256: str | None = None,
+    extracted: dict[str, Any] | None = None,
 ) -> tuple[bool, list[Failure]]:
+    """Bring scaffold_pack in line with prd_pack; callers that already hold the
+    PRD pack's hash or extraction pass them in instead of recomputing them."""
     updated = False
     failures: list[Failure] = []
 
@@ -45,16 +50,19 @@ def normalize_scaffold_pack(
         prd_rel = prd_pack_path.relative_to(workspace_root).as_posix()
     except ValueError:
         prd_rel = prd_pack_path.as_posix()
+    if prd_pack_sha256 is None and prd_pack_path.exists():
+        prd_pack_sha256 = _sha256_file(prd_pack_path)
     source = {
         "prd_pack_path": prd_rel,
         "prd_pack_schema_version": prd_pack.get("schema_version"),
-        "prd_pack_sha256": _sha256_file(prd_pack_path) if prd_pack_path.exists() else None,
+        "prd_pack_sha256": prd_pack_sha256,
     }
     if scaffold_pack.get("source") != source:
         scaffold_pack["source"] = source
         updated = True
 
-    extracted = extract_from_prd_pack(prd_pack)
+    if extracted is None:
+        extracted = extract_from_prd_pack(prd_pack)
     if scaffold_pack.get("extracted") != extracted:
         scaffold_pack["extracted"] = extracted
         updated = True
@@ -13,7 +13,12 @@ def _ensure_dir(path: Path) -> None:
 
 
 def read_scaffold_pack(path: Path) -> tuple[dict[str, Any] | None, list[Failure]]:
-    if not path.exists():
+    return parse_scaffold_pack(path, path.read_bytes() if path.exists() else None)
+
+
+def parse_scaffold_pack(path: Path, raw: bytes | None) -> tuple[dict[str, Any] | None, list[Failure]]:
+    """Parse the bytes already read from path; None means the file does not exist."""
+    if raw is None:
         return None, [
             Failure(
                 loc=str(path),
@@ -24,7 +29,7 @@ def read_scaffold_pack(path: Path) -> tuple[dict[str, Any] | None, list[Failure]
             )
         ]
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(raw.decode("utf-8"))
     except json.JSONDecodeError as error:
         return None, [
             Failure(
@@ -48,9 +53,11 @@ def read_scaffold_pack(path: Path) -> tuple[dict[str, Any] | None, list[Failure]
     return data, []
 
 
-def write_scaffold_pack(path: Path, scaffold_pack: dict[str, Any]) -> None:
+def write_scaffold_pack(path: Path, scaffold_pack: dict[str, Any]) -> str:
     _ensure_dir(path.parent)
-    path.write_text(json.dumps(scaffold_pack, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    text = json.dumps(scaffold_pack, ensure_ascii=False, indent=2) + "\n"
+    path.write_text(text, encoding="utf-8")
+    return text
 
 
 def init_scaffold_pack(template_path: Path, out_path: Path, *, force: bool) -> tuple[bool, list[Failure]]:
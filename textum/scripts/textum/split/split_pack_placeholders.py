@@ -1,20 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any
 
+from textum.prd.prd_pack_scan import scan_json
 from textum.prd.prd_pack_types import Failure, PLACEHOLDER_SENTINEL
 
 
-def iter_json_paths(value: Any, path: str = "$") -> Iterable[tuple[str, Any]]:
-    yield path, value
-    if isinstance(value, dict):
-        for key, child in value.items():
-            yield from iter_json_paths(child, f"{path}.{key}")
-    elif isinstance(value, list):
-        for index, child in enumerate(value):
-            yield from iter_json_paths(child, f"{path}[{index}]")
-
-
 def _examples_summary(examples: list[str], *, limit: int = 8) -> str:
     if len(examples) <= limit:
         return ", ".join(examples)
@@ -24,24 +15,11 @@ def _examples_summary(examples: list[str], *, limit: int = 8) -> str:
 
 
 def collect_placeholders(value: dict[str, Any]) -> list[Failure]:
-    fill_paths: list[str] = []
-    todo_paths: list[str] = []
-    ellipsis_paths: list[str] = []
-    fence_paths: list[str] = []
-    for path, node in iter_json_paths(value):
-        if not isinstance(node, str):
-            continue
-
-        if PLACEHOLDER_SENTINEL in node:
-            fill_paths.append(path)
-
-        stripped = node.strip()
-        if stripped.upper() in ("TBD", "TODO"):
-            todo_paths.append(f"{path}={stripped.upper()}")
-        if "[...]" in stripped:
-            ellipsis_paths.append(path)
-        if "```" in node:
-            fence_paths.append(path)
+    scan = scan_json(value)
+    fill_paths = scan.placeholder_paths
+    todo_paths = scan.todo_paths
+    ellipsis_paths = scan.ellipsis_paths
+    fence_paths = scan.fence_paths
 
     failures: list[Failure] = []
     if fill_paths:
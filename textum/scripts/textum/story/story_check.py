@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from textum.prd.prd_pack_maps import PrdMaps
 from textum.prd.prd_pack_types import Failure
 from .story_check_utils import scan_story_placeholders, scan_story_text
 from .story_check_validate_external import validate_story_against_prd, validate_story_against_scaffold
@@ -18,6 +19,7 @@ def check_story_source(
     max_chars: int,
     prd_pack: dict[str, Any] | None,
     scaffold_pack: dict[str, Any] | None,
+    prd_maps: PrdMaps | None = None,
 ) -> list[Failure]:
     failures: list[Failure] = []
 
@@ -50,6 +52,7 @@ def check_story_source(
             api_endpoints=ctx.get("api_endpoints", []),
             tbl_name_by_id=ctx.get("tbl_name_by_id", {}),
             prd_pack=prd_pack,
+            prd_maps=prd_maps,
         )
 
     if scaffold_pack is not None:
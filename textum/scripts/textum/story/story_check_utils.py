@@ -1,19 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any
 
 from textum.prd.prd_pack_types import PLACEHOLDER_SENTINEL, Failure
 from textum.prd.prd_pack_maps import build_prd_maps
-
-
-def iter_json_paths(value: Any, path: str = "$") -> Iterable[tuple[str, Any]]:
-    yield path, value
-    if isinstance(value, dict):
-        for key, child in value.items():
-            yield from iter_json_paths(child, f"{path}.{key}")
-    elif isinstance(value, list):
-        for index, child in enumerate(value):
-            yield from iter_json_paths(child, f"{path}[{index}]")
+from textum.prd.prd_pack_scan import scan_json
 
 
 def _examples_summary(examples: list[str], *, limit: int = 8) -> str:
@@ -50,17 +41,9 @@ def scan_story_text(text: str, *, path: str) -> list[Failure]:
 
 
 def scan_story_placeholders(story: dict[str, Any], *, path: str) -> list[Failure]:
-    todo_paths: list[str] = []
-    ellipsis_paths: list[str] = []
-    for loc, value in iter_json_paths(story):
-        if not isinstance(value, str):
-            continue
-
-        stripped = value.strip()
-        if stripped.upper() in ("TBD", "TODO"):
-            todo_paths.append(f"{loc}={stripped.upper()}")
-        if "[...]" in stripped:
-            ellipsis_paths.append(loc)
+    scan = scan_json(story)
+    todo_paths = scan.todo_paths
+    ellipsis_paths = scan.ellipsis_paths
 
     def placeholder_fix(paths: list[str], *, placeholder: str) -> str:
         if any(p.startswith("$.details") for p in paths):
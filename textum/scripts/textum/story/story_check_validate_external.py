@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from textum.prd.prd_pack_maps import PrdMaps
 from textum.prd.prd_pack_types import Failure
 from .story_check_utils import build_prd_maps, build_scaffold_module_ids
 
@@ -16,9 +17,10 @@ def validate_story_against_prd(
     api_endpoints: list[Any],
     tbl_name_by_id: dict[str, str],
     prd_pack: dict[str, Any],
+    prd_maps: PrdMaps | None = None,
 ) -> list[Failure]:
     failures: list[Failure] = []
-    api_by_id, tbl_by_id, prd_fp_ids, br_by_id = build_prd_maps(prd_pack)
+    api_by_id, tbl_by_id, prd_fp_ids, br_by_id = prd_maps if prd_maps is not None else build_prd_maps(prd_pack)
 
     for idx, fp_id in enumerate(fp_ids):
         if fp_id not in prd_fp_ids:
@@ -4,6 +4,7 @@ import shutil
 from pathlib import Path
 from typing import Any
 
+from textum.prd.prd_pack_maps import PrdMaps
 from textum.prd.prd_pack_types import Failure
 from textum.prd.prd_slices_types import SliceBudget
 from textum.prd.prd_slices_utils import chunk_list, rel_posix
@@ -38,6 +39,10 @@ def write_story_exec_pack(
     out_dir: Path,
     budget: SliceBudget,
     clean: bool,
+    story_source_sha256: str | None = None,
+    prd_pack_sha256: str | None = None,
+    scaffold_pack_sha256: str | None = None,
+    prd_maps: PrdMaps | None = None,
 ) -> tuple[Path | None, list[Path], list[Failure]]:
     if clean and out_dir.exists():
         shutil.rmtree(out_dir)
@@ -53,7 +58,11 @@ def write_story_exec_pack(
         return None, [], snapshot_failures
 
     tables, business_rules, context_failures = collect_story_prd_context(
-        story=story, prd_pack=prd_pack, story_source_path=story_source_path, workspace_root=workspace_root
+        story=story,
+        prd_pack=prd_pack,
+        story_source_path=story_source_path,
+        workspace_root=workspace_root,
+        prd_maps=prd_maps,
     )
     if context_failures:
         return None, [], context_failures
@@ -76,6 +85,9 @@ def write_story_exec_pack(
         prd_pack=prd_pack,
         scaffold_pack_path=scaffold_pack_path,
         scaffold_pack=scaffold_pack,
+        story_source_sha256=story_source_sha256,
+        prd_pack_sha256=prd_pack_sha256,
+        scaffold_pack_sha256=scaffold_pack_sha256,
     )
 
     base_path, base_lines, base_chars, base_failures = write_story_exec_context_base(
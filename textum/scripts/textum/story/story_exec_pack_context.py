@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from textum.prd.prd_pack_maps import build_prd_maps
+from textum.prd.prd_pack_maps import PrdMaps, build_prd_maps
 from textum.prd.prd_pack_types import Failure
 from textum.prd.prd_slices_utils import rel_posix
 
@@ -14,12 +14,13 @@ def collect_story_prd_context(
     prd_pack: dict[str, Any],
     story_source_path: Path,
     workspace_root: Path,
+    prd_maps: PrdMaps | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[Failure]]:
     story_refs = story.get("refs") if isinstance(story.get("refs"), dict) else {}
     prd_tbl_ids = story_refs.get("prd_tbl") if isinstance(story_refs.get("prd_tbl"), list) else []
     prd_br_ids = story_refs.get("prd_br") if isinstance(story_refs.get("prd_br"), list) else []
 
-    _, tbl_by_id, _, br_by_id = build_prd_maps(prd_pack)
+    _, tbl_by_id, _, br_by_id = prd_maps if prd_maps is not None else build_prd_maps(prd_pack)
 
     tables: list[dict[str, Any]] = []
     for idx, tbl_id in enumerate(prd_tbl_ids):
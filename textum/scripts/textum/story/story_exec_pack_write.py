@@ -21,16 +21,26 @@ def build_story_exec_source(
     prd_pack: dict[str, Any],
     scaffold_pack_path: Path,
     scaffold_pack: dict[str, Any],
+    story_source_sha256: str | None = None,
+    prd_pack_sha256: str | None = None,
+    scaffold_pack_sha256: str | None = None,
 ) -> dict[str, Any]:
+    """Hashes the caller already holds are used as given; missing ones are read from disk."""
+    if story_source_sha256 is None:
+        story_source_sha256 = sha256_file(story_source_path)
+    if prd_pack_sha256 is None and prd_pack_path.exists():
+        prd_pack_sha256 = sha256_file(prd_pack_path)
+    if scaffold_pack_sha256 is None and scaffold_pack_path.exists():
+        scaffold_pack_sha256 = sha256_file(scaffold_pack_path)
     return {
         "story_source_path": rel_posix(story_source_path, workspace_root),
-        "story_source_sha256": sha256_file(story_source_path),
+        "story_source_sha256": story_source_sha256,
         "prd_pack_path": rel_posix(prd_pack_path, workspace_root),
         "prd_pack_schema_version": prd_pack.get("schema_version"),
-        "prd_pack_sha256": sha256_file(prd_pack_path) if prd_pack_path.exists() else None,
+        "prd_pack_sha256": prd_pack_sha256,
         "scaffold_pack_path": rel_posix(scaffold_pack_path, workspace_root),
         "scaffold_pack_schema_version": scaffold_pack.get("schema_version"),
-        "scaffold_pack_sha256": sha256_file(scaffold_pack_path) if scaffold_pack_path.exists() else None,
+        "scaffold_pack_sha256": scaffold_pack_sha256,
     }
 
 
@@ -57,7 +57,7 @@ def register_prd_commands(subparsers: Any) -> None:
         "--clean",
         action=argparse.BooleanOptionalAction,
         default=True,
-        help="Delete docs/prd-slices/ before writing (default: true).",
+        help="Remove stale files from docs/prd-slices/ (default: true).",
     )
     prd_slice.add_argument("--max-lines", type=int, default=350, help="Max lines per slice file (default: 350).")
     prd_slice.add_argument("--max-chars", type=int, default=12000, help="Max chars per slice file (default: 12000).")
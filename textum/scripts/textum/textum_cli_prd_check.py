@@ -3,17 +3,19 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from textum.prd.prd_pack import check_prd_pack, workspace_paths
+from textum.prd.prd_pack import check_prd_pack
 from .textum_cli_emit import emit_stage_result
 from .textum_cli_runner import check_stage_result
 from .textum_cli_support import _load_prd_pack_and_normalize
+from .textum_cli_workspace import Workspace
 
 
 def _cmd_prd_check(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
+    paths = session.paths
 
-    prd_pack, updated, failures = _load_prd_pack_and_normalize(paths, fix=args.fix)
+    prd_pack, updated, failures = _load_prd_pack_and_normalize(session, fix=args.fix)
     if failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -4,7 +4,15 @@ import argparse
 import json
 from pathlib import Path
 
-from textum.prd.prd_pack import normalize_prd_pack, read_prd_pack, workspace_paths, write_prd_pack
+from textum.prd.prd_pack import (
+    normalize_prd_pack,
+    read_prd_id_ledger,
+    read_prd_pack,
+    record_prd_ids,
+    workspace_paths,
+    write_prd_id_ledger,
+    write_prd_pack,
+)
 from textum.prd.prd_pack_types import Failure
 from .textum_cli_support import _print_failures
 from .textum_json_path import append_value, delete_value, set_value
@@ -107,6 +115,15 @@ def _cmd_prd_patch(args: argparse.Namespace) -> int:
             return 1
         value = None
 
+    # Remember the IDs as they were, so ones this patch deletes are never reassigned
+    ledger, ledger_failures = read_prd_id_ledger(paths["prd_id_ledger"])
+    if ledger_failures:
+        _print_failures(ledger_failures)
+        print("next: PRD Plan")
+        return 1
+    recorded = dict(ledger)
+    record_prd_ids(prd_pack, ledger)
+
     try:
         if op == "set":
             changed = set_value(prd_pack, args.path, value, create=args.create)  # type: ignore[arg-type]
@@ -145,7 +162,7 @@ def _cmd_prd_patch(args: argparse.Namespace) -> int:
 
     normalized = False
     if args.normalize:
-        normalized, normalize_failures = normalize_prd_pack(prd_pack)
+        normalized, normalize_failures = normalize_prd_pack(prd_pack, id_ledger=ledger)
         if normalize_failures:
             _print_failures(normalize_failures)
             print("next: PRD Plan")
@@ -154,6 +171,8 @@ def _cmd_prd_patch(args: argparse.Namespace) -> int:
     should_write = bool(changed or normalized)
     if should_write:
         write_prd_pack(paths["prd_pack"], prd_pack)
+    if ledger != recorded:
+        write_prd_id_ledger(paths["prd_id_ledger"], ledger)
 
     print("PASS")
     if should_write:
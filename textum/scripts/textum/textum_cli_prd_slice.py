@@ -3,18 +3,20 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from textum.prd.prd_pack import check_prd_pack, workspace_paths
+from textum.prd.prd_pack import check_prd_pack
 from textum.prd.prd_slices import SliceBudget, generate_prd_slices
 from .textum_cli_emit import emit_stage_result
 from .textum_cli_runner import simple_stage_result
 from .textum_cli_support import _load_prd_pack_and_normalize
+from .textum_cli_workspace import Workspace
 
 
 def _cmd_prd_slice(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
+    paths = session.paths
 
-    prd_pack, _, failures = _load_prd_pack_and_normalize(paths, fix=args.fix)
+    prd_pack, _, failures = _load_prd_pack_and_normalize(session, fix=args.fix)
     if failures:
         result = simple_stage_result(
             failures=failures,
@@ -48,6 +50,7 @@ def _cmd_prd_slice(args: argparse.Namespace) -> int:
         out_dir=paths["prd_slices_dir"],
         budget=budget,
         clean=args.clean,
+        prd_pack_sha256=session.prd_pack_sha256(),
     )
     if failures:
         result = simple_stage_result(
@@ -14,6 +14,7 @@ from .textum_cli_support import (
     _load_prd_pack_and_ensure_ready,
     _load_scaffold_pack_and_ensure_ready,
 )
+from .textum_cli_workspace import Workspace
 
 
 def _cmd_scaffold_init(args: argparse.Namespace) -> int:
@@ -36,9 +37,10 @@ def _cmd_scaffold_init(args: argparse.Namespace) -> int:
 
 def _cmd_scaffold_check(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
+    paths = session.paths
 
-    prd_pack, prd_failures = _load_prd_pack_and_ensure_ready(paths)
+    prd_pack, prd_failures = _load_prd_pack_and_ensure_ready(session)
     if prd_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -54,7 +56,7 @@ def _cmd_scaffold_check(args: argparse.Namespace) -> int:
     assert prd_pack is not None
 
     scaffold_pack, updated, scaffold_failures = _load_scaffold_pack_and_ensure_ready(
-        paths, prd_pack=prd_pack, fix=args.fix
+        session, prd_pack=prd_pack, fix=args.fix
     )
     if scaffold_failures:
         result = check_stage_result(
@@ -87,9 +89,10 @@ def _cmd_scaffold_check(args: argparse.Namespace) -> int:
 
 def _cmd_scaffold_render(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
+    paths = session.paths
 
-    prd_pack, prd_failures = _load_prd_pack_and_ensure_ready(paths)
+    prd_pack, prd_failures = _load_prd_pack_and_ensure_ready(session)
     if prd_failures:
         result = simple_stage_result(
             failures=prd_failures,
@@ -104,7 +107,7 @@ def _cmd_scaffold_render(args: argparse.Namespace) -> int:
     assert prd_pack is not None
 
     scaffold_pack, _, scaffold_failures = _load_scaffold_pack_and_ensure_ready(
-        paths, prd_pack=prd_pack, fix=args.fix
+        session, prd_pack=prd_pack, fix=args.fix
     )
     if scaffold_failures:
         result = simple_stage_result(
@@ -3,20 +3,20 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from textum.prd.prd_pack import read_prd_pack, workspace_paths
-from textum.scaffold.scaffold_pack import read_scaffold_pack
 from textum.split.split_check_refs import validate_split_refs
 from textum.split.split_pack_io import read_json_object
 from .textum_cli_emit import emit_stage_result
 from .textum_cli_runner import check_stage_result
 from .textum_cli_support import _ensure_prd_ready, _ensure_scaffold_ready
+from .textum_cli_workspace import Workspace
 
 
 def _cmd_split_check2(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
+    paths = session.paths
 
-    prd_pack, prd_read_failures = read_prd_pack(paths["prd_pack"])
+    prd_pack, prd_read_failures = session.prd_pack()
     if prd_read_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -31,7 +31,7 @@ def _cmd_split_check2(args: argparse.Namespace) -> int:
         return result.exit_code
     assert prd_pack is not None
 
-    prd_ready_failures = _ensure_prd_ready(prd_pack, prd_pack_path=paths["prd_pack"])
+    prd_ready_failures = _ensure_prd_ready(prd_pack, workspace=session)
     if prd_ready_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -45,7 +45,7 @@ def _cmd_split_check2(args: argparse.Namespace) -> int:
         emit_stage_result(result)
         return result.exit_code
 
-    scaffold_pack, scaffold_read_failures = read_scaffold_pack(paths["scaffold_pack"])
+    scaffold_pack, scaffold_read_failures = session.scaffold_pack()
     if scaffold_read_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -62,9 +62,8 @@ def _cmd_split_check2(args: argparse.Namespace) -> int:
 
     scaffold_updated, scaffold_ready_failures = _ensure_scaffold_ready(
         scaffold_pack,  # type: ignore[arg-type]
-        prd_pack_path=paths["prd_pack"],
         prd_pack=prd_pack,  # type: ignore[arg-type]
-        scaffold_pack_path=paths["scaffold_pack"],
+        workspace=session,
         fix=args.fix,
     )
     scaffold_pack_written = scaffold_updated and args.fix
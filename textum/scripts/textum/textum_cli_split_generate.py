@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from textum.prd.prd_pack import read_prd_pack, workspace_paths
-from textum.scaffold.scaffold_pack import read_scaffold_pack
 from textum.split.split_plan_pack import (
     check_split_plan_pack,
     normalize_split_plan_pack,
@@ -14,24 +12,26 @@ from textum.split.split_plan_pack import (
 from textum.split.split_story_generate import generate_story_files
 from .textum_cli_next import _print_failures_with_next
 from .textum_cli_support import _ensure_prd_ready, _ensure_scaffold_ready
+from .textum_cli_workspace import Workspace
 
 
 def _cmd_split_generate(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
+    paths = session.paths
 
-    prd_pack, prd_read_failures = read_prd_pack(paths["prd_pack"])
+    prd_pack, prd_read_failures = session.prd_pack()
     if prd_read_failures:
         _print_failures_with_next(prd_read_failures, fallback="Split Plan")
         return 1
     assert prd_pack is not None
 
-    prd_ready_failures = _ensure_prd_ready(prd_pack, prd_pack_path=paths["prd_pack"])
+    prd_ready_failures = _ensure_prd_ready(prd_pack, workspace=session)
     if prd_ready_failures:
         _print_failures_with_next(prd_ready_failures, fallback="Split Plan")
         return 1
 
-    scaffold_pack, scaffold_read_failures = read_scaffold_pack(paths["scaffold_pack"])
+    scaffold_pack, scaffold_read_failures = session.scaffold_pack()
     if scaffold_read_failures:
         _print_failures_with_next(scaffold_read_failures, fallback="Split Plan")
         return 1
@@ -39,9 +39,8 @@ def _cmd_split_generate(args: argparse.Namespace) -> int:
 
     scaffold_updated, scaffold_ready_failures = _ensure_scaffold_ready(
         scaffold_pack,  # type: ignore[arg-type]
-        prd_pack_path=paths["prd_pack"],
         prd_pack=prd_pack,  # type: ignore[arg-type]
-        scaffold_pack_path=paths["scaffold_pack"],
+        workspace=session,
         fix=args.fix,
     )
     scaffold_pack_written = scaffold_updated and args.fix
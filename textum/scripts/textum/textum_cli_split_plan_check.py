@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from textum.prd.prd_pack import read_prd_pack, workspace_paths
-from textum.scaffold.scaffold_pack import read_scaffold_pack
 from textum.split.split_plan_pack import (
     check_split_plan_pack,
     normalize_split_plan_pack,
@@ -14,13 +12,15 @@ from textum.split.split_plan_pack import (
 from .textum_cli_emit import emit_stage_result
 from .textum_cli_runner import check_stage_result
 from .textum_cli_support import _ensure_prd_ready, _ensure_scaffold_ready, _print_check_items
+from .textum_cli_workspace import Workspace
 
 
 def _cmd_split_plan_check(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
+    paths = session.paths
 
-    prd_pack, prd_read_failures = read_prd_pack(paths["prd_pack"])
+    prd_pack, prd_read_failures = session.prd_pack()
     if prd_read_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -35,7 +35,7 @@ def _cmd_split_plan_check(args: argparse.Namespace) -> int:
         return result.exit_code
     assert prd_pack is not None
 
-    prd_ready_failures = _ensure_prd_ready(prd_pack, prd_pack_path=paths["prd_pack"])
+    prd_ready_failures = _ensure_prd_ready(prd_pack, workspace=session)
     if prd_ready_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -49,7 +49,7 @@ def _cmd_split_plan_check(args: argparse.Namespace) -> int:
         emit_stage_result(result)
         return result.exit_code
 
-    scaffold_pack, scaffold_read_failures = read_scaffold_pack(paths["scaffold_pack"])
+    scaffold_pack, scaffold_read_failures = session.scaffold_pack()
     if scaffold_read_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -66,9 +66,8 @@ def _cmd_split_plan_check(args: argparse.Namespace) -> int:
 
     scaffold_updated, scaffold_ready_failures = _ensure_scaffold_ready(
         scaffold_pack,  # type: ignore[arg-type]
-        prd_pack_path=paths["prd_pack"],
         prd_pack=prd_pack,  # type: ignore[arg-type]
-        scaffold_pack_path=paths["scaffold_pack"],
+        workspace=session,
         fix=args.fix,
     )
     scaffold_pack_written = scaffold_updated and args.fix
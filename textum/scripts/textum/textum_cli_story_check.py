@@ -3,20 +3,19 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from textum.prd.prd_pack import read_prd_pack, workspace_paths
-from textum.scaffold.scaffold_pack import check_scaffold_pack, read_scaffold_pack
+from textum.scaffold.scaffold_pack import check_scaffold_pack
 from textum.story.story_check import check_story_source
 from .textum_cli_emit import emit_stage_result
 from .textum_cli_runner import check_stage_result
-from .textum_cli_story_load import load_story_source
 from .textum_cli_support import _ensure_prd_ready, _require_scaffold_extracted_modules_index
+from .textum_cli_workspace import Workspace
 
 
 def _cmd_story_check(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
 
-    story_path, story_text, story, failures = load_story_source(stories_dir=paths["stories_dir"], n=args.n)
+    story_path, story_text, story, failures = session.story_source(args.n)
     if failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -33,7 +32,7 @@ def _cmd_story_check(args: argparse.Namespace) -> int:
     assert story_text is not None
     assert story is not None
 
-    prd_pack, prd_failures = read_prd_pack(paths["prd_pack"])
+    prd_pack, prd_failures = session.prd_pack()
     if prd_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -48,7 +47,7 @@ def _cmd_story_check(args: argparse.Namespace) -> int:
         return result.exit_code
     assert prd_pack is not None
 
-    prd_ready_failures = _ensure_prd_ready(prd_pack, prd_pack_path=paths["prd_pack"])
+    prd_ready_failures = _ensure_prd_ready(prd_pack, workspace=session)
     if prd_ready_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -62,7 +61,7 @@ def _cmd_story_check(args: argparse.Namespace) -> int:
         emit_stage_result(result)
         return result.exit_code
 
-    scaffold_pack, scaffold_failures = read_scaffold_pack(paths["scaffold_pack"])
+    scaffold_pack, scaffold_failures = session.scaffold_pack()
     if scaffold_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -115,6 +114,7 @@ def _cmd_story_check(args: argparse.Namespace) -> int:
         max_chars=args.max_chars,
         prd_pack=prd_pack,
         scaffold_pack=scaffold_pack,
+        prd_maps=session.prd_maps(),
     )
     result = check_stage_result(
         workspace_root=workspace,
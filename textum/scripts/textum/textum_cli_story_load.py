@@ -4,15 +4,11 @@ import json
 from pathlib import Path
 
 from textum.prd.prd_pack_types import Failure
-from textum.story.story_exec_paths import find_story_source
 
 
-def load_story_source(*, stories_dir: Path, n: int) -> tuple[Path | None, str | None, dict | None, list[Failure]]:
-    story_path, failures = find_story_source(stories_dir, n=n)
-    if failures:
-        return None, None, None, failures
-
-    story_text = story_path.read_text(encoding="utf-8")
+def parse_story_source(story_path: Path, raw: bytes) -> tuple[Path | None, str | None, dict | None, list[Failure]]:
+    # Same text read_text() would give: universal newlines
+    story_text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     try:
         story = json.loads(story_text)
     except json.JSONDecodeError as error:
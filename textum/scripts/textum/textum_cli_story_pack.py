@@ -3,24 +3,24 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from textum.prd.prd_pack import read_prd_pack, workspace_paths
 from textum.prd.prd_slices_types import SliceBudget
-from textum.scaffold.scaffold_pack import check_scaffold_pack, read_scaffold_pack
+from textum.scaffold.scaffold_pack import check_scaffold_pack
 from textum.story.story_check import check_story_source
 from textum.story.story_exec_pack import write_story_exec_pack
 from textum.story.story_exec_pack_validate import check_story_exec_pack
 from textum.story.story_exec_paths import story_exec_dir
 from .textum_cli_emit import emit_stage_result
 from .textum_cli_runner import check_stage_result
-from .textum_cli_story_load import load_story_source
 from .textum_cli_support import _ensure_prd_ready, _require_scaffold_extracted_modules_index
+from .textum_cli_workspace import Workspace
 
 
 def _cmd_story_pack(args: argparse.Namespace) -> int:
     workspace = Path(args.workspace).resolve()
-    paths = workspace_paths(workspace)
+    session = Workspace(workspace)
+    paths = session.paths
 
-    story_path, story_text, story, failures = load_story_source(stories_dir=paths["stories_dir"], n=args.n)
+    story_path, story_text, story, failures = session.story_source(args.n)
     if failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -37,7 +37,7 @@ def _cmd_story_pack(args: argparse.Namespace) -> int:
     assert story_text is not None
     assert story is not None
 
-    prd_pack, prd_failures = read_prd_pack(paths["prd_pack"])
+    prd_pack, prd_failures = session.prd_pack()
     if prd_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -52,7 +52,7 @@ def _cmd_story_pack(args: argparse.Namespace) -> int:
         return result.exit_code
     assert prd_pack is not None
 
-    prd_ready_failures = _ensure_prd_ready(prd_pack, prd_pack_path=paths["prd_pack"])
+    prd_ready_failures = _ensure_prd_ready(prd_pack, workspace=session)
     if prd_ready_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -66,7 +66,7 @@ def _cmd_story_pack(args: argparse.Namespace) -> int:
         emit_stage_result(result)
         return result.exit_code
 
-    scaffold_pack, scaffold_failures = read_scaffold_pack(paths["scaffold_pack"])
+    scaffold_pack, scaffold_failures = session.scaffold_pack()
     if scaffold_failures:
         result = check_stage_result(
             workspace_root=workspace,
@@ -119,6 +119,7 @@ def _cmd_story_pack(args: argparse.Namespace) -> int:
         max_chars=args.max_chars,
         prd_pack=prd_pack,
         scaffold_pack=scaffold_pack,
+        prd_maps=session.prd_maps(),
     )
     if failures:
         result = check_stage_result(
@@ -147,6 +148,10 @@ def _cmd_story_pack(args: argparse.Namespace) -> int:
         out_dir=exec_dir,
         budget=budget,
         clean=args.clean,
+        story_source_sha256=session.story_source_sha256(args.n),
+        prd_pack_sha256=session.prd_pack_sha256(),
+        scaffold_pack_sha256=session.scaffold_pack_sha256(),
+        prd_maps=session.prd_maps(),
     )
     if pack_failures:
         result = check_stage_result(
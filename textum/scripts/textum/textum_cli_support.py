@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Any
 
-from textum.prd.prd_pack import check_prd_pack, normalize_prd_pack, read_prd_pack, write_prd_pack
-from textum.prd.prd_pack_types import Failure
-from textum.scaffold.scaffold_pack import (
-    check_scaffold_pack,
-    normalize_scaffold_pack,
-    read_scaffold_pack,
-    write_scaffold_pack,
+from textum.prd.prd_pack import (
+    check_prd_pack,
+    normalize_prd_pack,
+    prd_id_ledger_path,
+    read_prd_id_ledger,
+    write_prd_id_ledger,
 )
+from textum.prd.prd_pack_types import Failure
+from textum.scaffold.scaffold_pack import check_scaffold_pack, normalize_scaffold_pack
+from .textum_cli_workspace import Workspace
 
 
 def _print_failures(failures: list[Failure]) -> None:
@@ -35,8 +36,8 @@ def _print_check_items(items: list[Failure], *, label: str) -> None:
         )
 
 
-def _load_prd_pack(paths: dict[str, Path]) -> tuple[dict[str, Any] | None, list[Failure]]:
-    prd_pack, read_failures = read_prd_pack(paths["prd_pack"])
+def _load_prd_pack(workspace: Workspace) -> tuple[dict[str, Any] | None, list[Failure]]:
+    prd_pack, read_failures = workspace.prd_pack()
     if read_failures:
         return None, read_failures
     assert prd_pack is not None
@@ -44,35 +45,43 @@ def _load_prd_pack(paths: dict[str, Path]) -> tuple[dict[str, Any] | None, list[
 
 
 def _normalize_prd_pack_in_place(
-    prd_pack: dict[str, Any], *, write_back_path: Path | None
+    prd_pack: dict[str, Any], *, workspace: Workspace, write_back: bool
 ) -> tuple[bool, list[Failure]]:
-    updated, id_failures = normalize_prd_pack(prd_pack)
+    ledger_path = prd_id_ledger_path(workspace.paths["prd_pack"])
+    ledger, ledger_failures = read_prd_id_ledger(ledger_path)
+    if ledger_failures:
+        return False, ledger_failures
+    recorded = dict(ledger)
+    updated, id_failures = normalize_prd_pack(prd_pack, id_ledger=ledger)
     if id_failures:
         return False, id_failures
-    if updated and write_back_path is not None:
-        write_prd_pack(write_back_path, prd_pack)
+    if updated and write_back:
+        workspace.write_prd_pack(prd_pack)
+    elif updated:
+        workspace.prd_pack_changed()
+    # The ledger may only record IDs that made it into the pack on disk
+    if write_back and ledger != recorded:
+        write_prd_id_ledger(ledger_path, ledger)
     return updated, []
 
 
 def _load_prd_pack_and_normalize(
-    paths: dict[str, Path], *, fix: bool
+    workspace: Workspace, *, fix: bool
 ) -> tuple[dict[str, Any] | None, bool, list[Failure]]:
-    prd_pack, read_failures = _load_prd_pack(paths)
+    prd_pack, read_failures = _load_prd_pack(workspace)
     if read_failures:
         return None, False, read_failures
     assert prd_pack is not None
 
-    updated, id_failures = _normalize_prd_pack_in_place(
-        prd_pack, write_back_path=paths["prd_pack"] if fix else None
-    )
+    updated, id_failures = _normalize_prd_pack_in_place(prd_pack, workspace=workspace, write_back=fix)
     if id_failures:
         return None, updated, id_failures
 
     return prd_pack, updated, []
 
 
-def _ensure_prd_ready(prd_pack: dict[str, Any], *, prd_pack_path: Path) -> list[Failure]:
-    _, id_failures = _normalize_prd_pack_in_place(prd_pack, write_back_path=None)
+def _ensure_prd_ready(prd_pack: dict[str, Any], *, workspace: Workspace) -> list[Failure]:
+    _, id_failures = _normalize_prd_pack_in_place(prd_pack, workspace=workspace, write_back=False)
     if id_failures:
         return id_failures
     ready, check_failures = check_prd_pack(prd_pack)
@@ -81,13 +90,13 @@ def _ensure_prd_ready(prd_pack: dict[str, Any], *, prd_pack_path: Path) -> list[
     return []
 
 
-def _load_prd_pack_and_ensure_ready(paths: dict[str, Path]) -> tuple[dict[str, Any] | None, list[Failure]]:
-    prd_pack, read_failures = _load_prd_pack(paths)
+def _load_prd_pack_and_ensure_ready(workspace: Workspace) -> tuple[dict[str, Any] | None, list[Failure]]:
+    prd_pack, read_failures = _load_prd_pack(workspace)
     if read_failures:
         return None, read_failures
     assert prd_pack is not None
 
-    prd_ready_failures = _ensure_prd_ready(prd_pack, prd_pack_path=paths["prd_pack"])
+    prd_ready_failures = _ensure_prd_ready(prd_pack, workspace=workspace)
     if prd_ready_failures:
         return None, prd_ready_failures
 
@@ -97,16 +106,21 @@ def _load_prd_pack_and_ensure_ready(paths: dict[str, Path]) -> tuple[dict[str, A
 def _ensure_scaffold_ready(
     scaffold_pack: dict[str, object],
     *,
-    prd_pack_path: Path,
     prd_pack: dict[str, object],
-    scaffold_pack_path: Path,
+    workspace: Workspace,
     fix: bool,
 ) -> tuple[bool, list[Failure]]:
-    updated, failures = normalize_scaffold_pack(scaffold_pack, prd_pack_path=prd_pack_path, prd_pack=prd_pack)
+    updated, failures = normalize_scaffold_pack(
+        scaffold_pack,
+        prd_pack_path=workspace.paths["prd_pack"],
+        prd_pack=prd_pack,
+        prd_pack_sha256=workspace.prd_pack_sha256(),
+        extracted=workspace.scaffold_extracted(),
+    )
     if failures:
         return updated, failures
     if updated and fix:
-        write_scaffold_pack(scaffold_pack_path, scaffold_pack)  # type: ignore[arg-type]
+        workspace.write_scaffold_pack(scaffold_pack)  # type: ignore[arg-type]
     ready, check_failures = check_scaffold_pack(scaffold_pack)  # type: ignore[arg-type]
     if not ready:
         return updated, check_failures
@@ -114,18 +128,17 @@ def _ensure_scaffold_ready(
 
 
 def _load_scaffold_pack_and_ensure_ready(
-    paths: dict[str, Path], *, prd_pack: dict[str, Any], fix: bool
+    workspace: Workspace, *, prd_pack: dict[str, Any], fix: bool
 ) -> tuple[dict[str, Any] | None, bool, list[Failure]]:
-    scaffold_pack, read_failures = read_scaffold_pack(paths["scaffold_pack"])
+    scaffold_pack, read_failures = workspace.scaffold_pack()
     if read_failures:
         return None, False, read_failures
     assert scaffold_pack is not None
 
     updated, ready_failures = _ensure_scaffold_ready(
         scaffold_pack,  # type: ignore[arg-type]
-        prd_pack_path=paths["prd_pack"],
         prd_pack=prd_pack,  # type: ignore[arg-type]
-        scaffold_pack_path=paths["scaffold_pack"],
+        workspace=workspace,
         fix=fix,
     )
     if ready_failures:
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+from textum.prd.prd_pack import parse_prd_pack, workspace_paths, write_prd_pack
+from textum.prd.prd_pack_maps import PrdMaps, build_prd_maps
+from textum.prd.prd_pack_types import Failure
+from textum.scaffold.scaffold_pack import extract_from_prd_pack, parse_scaffold_pack, write_scaffold_pack
+from textum.story.story_exec_paths import find_story_source
+from .textum_cli_story_load import parse_story_source
+
+_Loaded = tuple[dict[str, Any] | None, list[Failure]]
+
+
+def _sha256_bytes(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+class Workspace:
+    """The packs of one CLI run.
+
+    Each file is read and parsed at most once; its sha256 is taken from the
+    bytes that were parsed, and the structures derived from the PRD pack are
+    memoized until the pack changes (prd_pack_changed / write_prd_pack).
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.paths = workspace_paths(root)
+        self._loaded: dict[str, _Loaded] = {}
+        self._sha256: dict[str, str | None] = {}
+        self._prd_maps: PrdMaps | None = None
+        self._scaffold_extracted: dict[str, Any] | None = None
+
+    def _load(self, key: str, parse: Callable[[Path, bytes | None], _Loaded]) -> _Loaded:
+        if key not in self._loaded:
+            path = self.paths[key]
+            raw = path.read_bytes() if path.exists() else None
+            self._loaded[key] = parse(path, raw)
+            self._sha256[key] = None if raw is None else _sha256_bytes(raw)
+        return self._loaded[key]
+
+    def _written(self, key: str, text: str) -> None:
+        # write_text() translates "\n" to os.linesep; hash what actually landed on disk
+        self._sha256[key] = _sha256_bytes(text.replace("\n", os.linesep).encode("utf-8"))
+
+    def prd_pack(self) -> _Loaded:
+        return self._load("prd_pack", parse_prd_pack)
+
+    def prd_pack_sha256(self) -> str | None:
+        self.prd_pack()
+        return self._sha256["prd_pack"]
+
+    def write_prd_pack(self, prd_pack: dict[str, Any]) -> None:
+        self._written("prd_pack", write_prd_pack(self.paths["prd_pack"], prd_pack))
+        self._loaded["prd_pack"] = (prd_pack, [])
+        self.prd_pack_changed()
+
+    def prd_pack_changed(self) -> None:
+        """Drop what was derived from the PRD pack after it was modified in place."""
+        self._prd_maps = None
+        self._scaffold_extracted = None
+
+    def prd_maps(self) -> PrdMaps:
+        if self._prd_maps is None:
+            prd_pack, _ = self.prd_pack()
+            self._prd_maps = build_prd_maps(prd_pack or {})
+        return self._prd_maps
+
+    def scaffold_extracted(self) -> dict[str, Any]:
+        if self._scaffold_extracted is None:
+            prd_pack, _ = self.prd_pack()
+            self._scaffold_extracted = extract_from_prd_pack(prd_pack or {})
+        return self._scaffold_extracted
+
+    def scaffold_pack(self) -> _Loaded:
+        return self._load("scaffold_pack", parse_scaffold_pack)
+
+    def scaffold_pack_sha256(self) -> str | None:
+        self.scaffold_pack()
+        return self._sha256["scaffold_pack"]
+
+    def write_scaffold_pack(self, scaffold_pack: dict[str, Any]) -> None:
+        self._written("scaffold_pack", write_scaffold_pack(self.paths["scaffold_pack"], scaffold_pack))
+        self._loaded["scaffold_pack"] = (scaffold_pack, [])
+
+    def story_source(self, n: int) -> tuple[Path | None, str | None, dict | None, list[Failure]]:
+        story_path, failures = find_story_source(self.paths["stories_dir"], n=n)
+        if failures:
+            return None, None, None, failures
+        raw = story_path.read_bytes()
+        self._sha256[f"story:{n}"] = _sha256_bytes(raw)
+        return parse_story_source(story_path, raw)
+
+    def story_source_sha256(self, n: int) -> str | None:
+        return self._sha256.get(f"story:{n}")
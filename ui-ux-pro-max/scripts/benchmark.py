@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmark - scaling suite for the BM25 search engine
+Usage: python benchmark.py [--rows 1000,10000,100000] [--queries 200] [--output bench-results.json]
+       python benchmark.py --rows 1000 --baseline bench-results.json
+       python benchmark.py --startup [--startup-budget-ms 38.6]
+
+Generates synthetic CSVs matching every CSV_CONFIG schema (plus one stack and
+the reasoning table) at each row count, then measures index build time, query
+latency (p50/p99), peak memory and CLI cold-start time. Each scale runs in its
+own process against its own data and cache directories.
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REAL_DATA_DIR = SCRIPTS_DIR.parent / "data"
+DEFAULT_ROWS = [1000, 10000, 100000]
+DEFAULT_QUERIES = 200
+BENCH_STACK = "react"
+REGRESSION_RATIO = 1.2
+# Import-time budget for a one-shot `search.py --domain` call (python -X importtime, all modules,
+# median of STARTUP_RUNS with warm bytecode). The budget is the original scripts' 38.6ms on a
+# shared Linux VM; the index cache is read with the built-in marshal, so csv and json are not
+# imported at all. tests/test_startup.py runs this check.
+STARTUP_BUDGET_MS = 38.6
+STARTUP_RUNS = 5
+# Rows appended to each CSV to time the incremental (delta segment) index update
+APPEND_ROWS = 10
+
+
+# ============ SYNTHETIC DATA ============
+def _vocabulary(rows, rng):
+    """Real words from the shipped CSVs plus synthetic terms, growing with corpus size"""
+    words = set()
+    for filepath in REAL_DATA_DIR.rglob("*.csv"):
+        words.update(w for w in re.findall(r"[a-z]+", filepath.read_text(encoding="utf-8").lower()) if len(w) > 2)
+    vocab = sorted(words)
+    # Heaps' law style growth: bigger corpora bring new terms
+    vocab += [f"term{i}" for i in range(int(40 * rows ** 0.5))]
+    rng.shuffle(vocab)
+    return vocab
+
+
+def _sampler(vocab, rng):
+    """Zipf-distributed word sampler over the vocabulary"""
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, len(vocab) + 1):
+        total += 1.0 / rank
+        cum_weights.append(total)
+
+    def sample(low, high):
+        return " ".join(rng.choices(vocab, cum_weights=cum_weights, k=rng.randint(low, high)))
+
+    return sample
+
+
+def _write_csv(filepath, columns, rows, sample, overrides=None):
+    """Write a synthetic CSV with the given header"""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for i in range(rows):
+            row = []
+            for col in columns:
+                if overrides and col in overrides:
+                    row.append(overrides[col](i))
+                else:
+                    row.append(sample(3, 12))
+            writer.writerow(row)
+
+
+def generate_dataset(data_dir, rows, seed):
+    """Generate every domain CSV, one stack CSV and the reasoning table at a row count"""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from core import CSV_CONFIG, STACK_CONFIG, _STACK_COLS
+    from design_system import REASONING_FILE
+
+    rng = random.Random(seed)
+    sample = _sampler(_vocabulary(rows, rng), rng)
+
+    for config in CSV_CONFIG.values():
+        columns = list(dict.fromkeys(config["search_cols"] + config["output_cols"]))
+        _write_csv(data_dir / config["file"], columns, rows, sample)
+
+    stack_columns = list(dict.fromkeys(_STACK_COLS["search_cols"] + _STACK_COLS["output_cols"]))
+    _write_csv(data_dir / STACK_CONFIG[BENCH_STACK]["file"], stack_columns, rows, sample)
+
+    with open(REAL_DATA_DIR / REASONING_FILE, encoding="utf-8") as f:
+        reasoning_columns = next(csv.reader(f))
+    _write_csv(data_dir / REASONING_FILE, reasoning_columns, rows, sample, {
+        "No": lambda i: str(i + 1),
+        "Style_Priority": lambda i: f"{sample(1, 2)} + {sample(1, 2)}",
+        "Decision_Rules": lambda i: "{}",
+        "Severity": lambda i: "MEDIUM",
+    })
+
+
+# ============ MEASUREMENT ============
+def _percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _latency(fn, args_list):
+    """Run fn over each argument tuple; return p50/p99/mean latency in seconds"""
+    samples = []
+    for args in args_list:
+        start = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - start)
+    return {
+        "p50": _percentile(samples, 50),
+        "p99": _percentile(samples, 99),
+        "mean": sum(samples) / len(samples) if samples else None,
+        "count": len(samples),
+    }
+
+
+def _queries(index, count, rng):
+    """Random 2-4 term queries drawn from an index's own vocabulary"""
+    terms = sorted(index.bm25.postings)
+    if not terms:
+        return []
+    return [" ".join(rng.choices(terms, k=rng.randint(2, 4))) for _ in range(count)]
+
+
+def run_worker(rows, query_count, seed):
+    """Measure one scale; DATA_DIR and CACHE_DIR come from the environment"""
+    import core
+    import design_system
+
+    rng = random.Random(seed)
+    report = {"rows": rows, "domains": {}}
+    targets = [(domain, config["file"], config["search_cols"], config["output_cols"]) for domain, config in core.CSV_CONFIG.items()]
+    targets.append((f"stack:{BENCH_STACK}", core.STACK_CONFIG[BENCH_STACK]["file"], core._STACK_COLS["search_cols"], core._STACK_COLS["output_cols"]))
+
+    for name, file, search_cols, output_cols in targets:
+        filepath = core.DATA_DIR / file
+        raw = filepath.read_bytes()
+
+        start = time.perf_counter()
+        index = core.load_index(filepath, search_cols, output_cols)
+        build_seconds = time.perf_counter() - start
+
+        core._INDEXES.clear()
+        start = time.perf_counter()
+        core.load_index(filepath, search_cols, output_cols)
+        cached_load_seconds = time.perf_counter() - start
+
+        with open(filepath, encoding="utf-8") as f:
+            documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in csv.DictReader(f)]
+        start = time.perf_counter()
+        core.BM25().fit(documents)
+        fit_seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        core._build_index(raw, search_cols, output_cols)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        queries = _queries(index, query_count, rng)
+        search_csv = _latency(core._search_csv, [(filepath, search_cols, output_cols, q, core.MAX_RESULTS) for q in queries])
+
+        # Append copies of the last rows: the reload indexes only those as a delta segment
+        with open(filepath, "ab") as f:
+            f.write(b"".join(raw.splitlines(keepends=True)[-APPEND_ROWS:]))
+        start = time.perf_counter()
+        core.load_index(filepath, search_cols, output_cols)
+        append_seconds = time.perf_counter() - start
+        for thread in threading.enumerate():
+            if thread.name == "ui-ux-pro-max-merge":
+                thread.join()
+
+        report["domains"][name] = {
+            "file_bytes": len(raw),
+            "terms": len(index.bm25.postings),
+            "build_seconds": build_seconds,
+            "cached_load_seconds": cached_load_seconds,
+            "fit_seconds": fit_seconds,
+            "peak_memory_bytes": peak_memory,
+            "bm25_score": _latency(index.bm25.score, [(q, core.MAX_RESULTS) for q in queries]),
+            "search_csv": search_csv,
+            "append_seconds": append_seconds,
+        }
+
+    product_config = core.CSV_CONFIG["product"]
+    product_index = core.load_index(core.DATA_DIR / product_config["file"], product_config["search_cols"], product_config["output_cols"])
+    design_queries = _queries(product_index, max(1, query_count // 10), rng)
+    design_system.generate_design_system("warm up")  # warm the generator and reasoning matcher
+    report["design_system"] = _latency(design_system.generate_design_system, [(q,) for q in design_queries])
+    # Same queries again: served from the result cache
+    report["design_system_cached"] = _latency(design_system.generate_design_system, [(q,) for q in design_queries])
+    return report
+
+
+def measure_cold_start(env, query):
+    """Wall time of one-shot CLI invocations with an empty index cache, a warm one and only a bundle"""
+    search_py = str(SCRIPTS_DIR / "search.py")
+    # The bundle defaults to the cache directory, so clearing the cache also removes it
+    build_bundle = [sys.executable, str(SCRIPTS_DIR / "bundle.py")]
+    commands = {
+        "domain_search": [sys.executable, search_py, query, "--domain", "style"],
+        "design_system": [sys.executable, search_py, query, "--design-system"],
+    }
+    report = {}
+    for name, command in commands.items():
+        shutil.rmtree(env["UI_UX_PRO_MAX_CACHE_DIR"], ignore_errors=True)
+        timings = {}
+        for phase in ("empty_cache", "warm_cache"):
+            start = time.perf_counter()
+            subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+            timings[phase] = time.perf_counter() - start
+        shutil.rmtree(env["UI_UX_PRO_MAX_CACHE_DIR"], ignore_errors=True)
+        subprocess.run(build_bundle, env=env, check=True, stdout=subprocess.DEVNULL)
+        start = time.perf_counter()
+        subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+        timings["bundle"] = time.perf_counter() - start
+        report[name] = timings
+    return report
+
+
+def measure_startup(budget_ms=STARTUP_BUDGET_MS):
+    """python -X importtime report for one-shot CLI calls, checked against a budget"""
+    search_py = str(SCRIPTS_DIR / "search.py")
+    commands = {
+        "domain_search": [sys.executable, "-X", "importtime", search_py, "button", "--domain", "style"],
+        "design_system": [sys.executable, "-X", "importtime", search_py, "saas", "--design-system"],
+    }
+    report = {"budget_ms": budget_ms}
+    with tempfile.TemporaryDirectory(prefix="uupm-pycache-") as pycache:
+        # Bytecode must be cacheable even where PYTHONDONTWRITEBYTECODE is set, or every run
+        # measures compiling the scripts instead of importing them
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        for name, command in commands.items():
+            # Warm-up run fills the bytecode cache; the median run is reported
+            subprocess.run(command, env=env, check=True, capture_output=True)
+            runs = []
+            for _ in range(STARTUP_RUNS):
+                start = time.perf_counter()
+                completed = subprocess.run(command, env=env, check=True, capture_output=True, text=True)
+                wall = time.perf_counter() - start
+
+                modules = []
+                for line in completed.stderr.splitlines():
+                    match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)", line)
+                    if match and not match.group(3):
+                        modules.append((match.group(4), int(match.group(2))))
+                runs.append({
+                    "wall_seconds": wall,
+                    "import_ms": sum(cumulative for _, cumulative in modules) / 1000,
+                    "top_level_modules": dict(sorted(modules, key=lambda item: item[1], reverse=True)[:10]),
+                })
+            report[name] = sorted(runs, key=lambda run: run["import_ms"])[len(runs) // 2]
+    report["within_budget"] = report["domain_search"]["import_ms"] <= budget_ms
+    return report
+
+
+def summarize_startup(report):
+    """Human-readable import-time report"""
+    lines = [f"## startup (budget {report['budget_ms']}ms for domain_search)"]
+    for name in ("domain_search", "design_system"):
+        metrics = report[name]
+        lines.append(f"- {name}: imports {metrics['import_ms']:.1f}ms | wall {metrics['wall_seconds'] * 1000:.1f}ms")
+        for module, cumulative in metrics["top_level_modules"].items():
+            lines.append(f"    {cumulative / 1000:7.2f}ms  {module}")
+    lines.append("- within budget" if report["within_budget"] else "- OVER BUDGET")
+    return "\n".join(lines)
+
+
+def run_scale(rows, query_count, seed):
+    """Generate a dataset and measure it in a fresh worker process"""
+    with tempfile.TemporaryDirectory(prefix=f"uupm-bench-{rows}-") as tmp:
+        data_dir = Path(tmp) / "data"
+        generate_dataset(data_dir, rows, seed)
+        env = dict(os.environ, UI_UX_PRO_MAX_DATA_DIR=str(data_dir), UI_UX_PRO_MAX_CACHE_DIR=str(Path(tmp) / "cache"))
+
+        command = [sys.executable, str(Path(__file__).resolve()), "--worker", str(rows), "--queries", str(query_count), "--seed", str(seed)]
+        completed = subprocess.run(command, env=env, check=True, stdout=subprocess.PIPE, text=True)
+        report = json.loads(completed.stdout)
+        report["cold_start_seconds"] = measure_cold_start(env, "term0 term1 design")
+        return report
+
+
+# ============ REPORTING ============
+def _flatten(value, prefix=""):
+    """Flatten nested report dicts into {dotted.path: number}"""
+    flat = {}
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flat.update(_flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        flat[prefix] = value
+    return flat
+
+
+def compare(baseline, current, threshold=REGRESSION_RATIO):
+    """Lines for metrics that grew by at least `threshold` times against a baseline"""
+    old = {}
+    for scale in baseline.get("scales", []):
+        old.update(_flatten(scale, f"rows={scale['rows']}"))
+    lines = []
+    for scale in current["scales"]:
+        for key, value in _flatten(scale, f"rows={scale['rows']}").items():
+            before = old.get(key)
+            if key.endswith((".rows", ".count", ".terms", ".file_bytes")) or not before or not value:
+                continue
+            ratio = value / before
+            if ratio >= threshold:
+                lines.append(f"REGRESSION {key}: {before:.6g} -> {value:.6g} ({ratio:.2f}x)")
+    return lines
+
+
+def summarize(report):
+    """Human-readable summary of one scale"""
+    lines = [f"## rows={report['rows']}"]
+    for name, metrics in report["domains"].items():
+        lines.append(
+            f"- {name}: build {metrics['build_seconds'] * 1000:.1f}ms"
+            f" | cached load {metrics['cached_load_seconds'] * 1000:.1f}ms"
+            f" | append {metrics['append_seconds'] * 1000:.1f}ms"
+            f" | query p50 {metrics['search_csv']['p50'] * 1000:.3f}ms p99 {metrics['search_csv']['p99'] * 1000:.3f}ms"
+            f" | peak {metrics['peak_memory_bytes'] / 1e6:.1f}MB"
+        )
+    ds = report["design_system"]
+    cached = report["design_system_cached"]
+    lines.append(
+        f"- design system: p50 {ds['p50'] * 1000:.2f}ms p99 {ds['p99'] * 1000:.2f}ms"
+        f" | cached p50 {cached['p50'] * 1e6:.1f}us p99 {cached['p99'] * 1e6:.1f}us"
+    )
+    for name, timings in report["cold_start_seconds"].items():
+        lines.append(
+            f"- cold start {name}: empty cache {timings['empty_cache']:.2f}s | warm cache {timings['warm_cache']:.2f}s"
+            f" | bundle {timings['bundle']:.2f}s"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UI Pro Max search benchmark")
+    parser.add_argument("--rows", default=",".join(map(str, DEFAULT_ROWS)), help="Comma-separated row counts (default: 1000,10000,100000)")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES, help="Queries per domain (default: 200)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for data and queries")
+    parser.add_argument("--output", "-o", default="bench-results.json", help="Where to write machine-readable results")
+    parser.add_argument("--baseline", default=None, help="Previous results file to flag regressions against")
+    parser.add_argument("--startup", action="store_true", help="Only run the import-time startup check")
+    parser.add_argument("--startup-budget-ms", type=float, default=STARTUP_BUDGET_MS, help=f"Import-time budget for a domain search (default: {STARTUP_BUDGET_MS:g})")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_RATIO, help="Slowdown ratio reported as a regression (default: 1.2)")
+    parser.add_argument("--worker", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(run_worker(args.worker, args.queries, args.seed)))
+        return 0
+
+    startup = measure_startup(args.startup_budget_ms)
+    print(summarize_startup(startup), flush=True)
+    if args.startup:
+        return 0 if startup["within_budget"] else 1
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "queries": args.queries,
+            "seed": args.seed,
+        },
+        "startup": startup,
+        "scales": [],
+    }
+    for rows in (int(value) for value in args.rows.split(",") if value.strip()):
+        report = run_scale(rows, args.queries, args.seed)
+        results["scales"].append(report)
+        print(summarize(report), flush=True)
+
+    Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(json.loads(Path(args.baseline).read_text(encoding="utf-8")), results, args.threshold)
+        print("\n".join(regressions) if regressions else "No regressions against baseline")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Bundle - compile every indexed CSV into one memory-mapped file
+Usage: python bundle.py [--output <path>]
+
+The bundle holds a shared string table plus, per CSV, the sorted term
+dictionary, IDF, per-term score upper bounds, postings, length norms and the
+output rows as string ids. core.py maps it read-only and serves searches
+straight from the mapping, so opening a domain costs a page fault instead of
+a CSV parse. The CSVs stay the source of truth: an entry whose CSV changed
+since the build is ignored and the CSV is indexed as usual. Rebuild the bundle
+after editing the data.
+"""
+
+import marshal
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from core import BM25, BUNDLE_PATH, CSV_CONFIG, DATA_DIR, STACK_CONFIG, _STACK_COLS, _build_index, _index_name
+
+MAGIC = b"UIUXBNDL"
+BUNDLE_VERSION = 4
+# magic, directory offset, directory length
+_HEADER = struct.Struct("<8sQQ")
+# String id stored for a missing cell (short CSV row)
+NO_VALUE = 0xFFFFFFFF
+
+
+def bundle_sources():
+    """(filepath, search_cols, output_cols) for every domain and stack CSV"""
+    sources = [(DATA_DIR / config["file"], config["search_cols"], config["output_cols"]) for config in CSV_CONFIG.values()]
+    sources += [(DATA_DIR / config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]) for config in STACK_CONFIG.values()]
+    return [source for source in sources if source[0].exists()]
+
+
+# ============ WRITER ============
+class _Writer:
+    """Appends 8-byte aligned sections and remembers where each one starts"""
+
+    def __init__(self, f):
+        self.f = f
+        self.pos = f.tell()
+
+    def section(self, data):
+        padding = -self.pos % 8
+        self.f.write(b"\0" * padding)
+        start = self.pos + padding
+        self.f.write(data)
+        self.pos = start + len(data)
+        return start
+
+
+def _index_sections(writer, index, intern_string):
+    """Write one index's arrays; returns their offsets and sizes for the directory"""
+    bm25 = index.bm25.merged()
+    terms = sorted(bm25.idf, key=lambda term: term.encode("utf-8"))
+
+    term_ids = array("I", (intern_string(term) for term in terms))
+    idf = array("d", (bm25.idf[term] for term in terms))
+    max_scores = array("d", (bm25.max_scores[term] for term in terms))
+    offsets = array("I", [0])
+    docs, tfs = array("I"), array("I")
+    for term in terms:
+        for idx, tf in bm25.postings[term]:
+            docs.append(idx)
+            tfs.append(tf)
+        offsets.append(len(docs))
+
+    rows = array("I")
+    for column_values in index.values:
+        rows.extend(NO_VALUE if value is None else intern_string(value) for value in column_values)
+
+    return {
+        "N": bm25.N,
+        "k1": bm25.k1,
+        "b": bm25.b,
+        "avgdl": bm25.avgdl,
+        "columns": list(index.columns),
+        "header": list(index.header),
+        "terms": (writer.section(term_ids.tobytes()), len(terms)),
+        "idf": writer.section(idf.tobytes()),
+        "max_scores": writer.section(max_scores.tobytes()),
+        "offsets": writer.section(offsets.tobytes()),
+        "docs": writer.section(docs.tobytes()),
+        "tfs": writer.section(tfs.tobytes()),
+        "doc_norms": writer.section(array("d", bm25.doc_norms).tobytes()),
+        "rows": writer.section(rows.tobytes()),
+    }
+
+
+def build_bundle(output=BUNDLE_PATH, sources=None):
+    """Compile the CSVs into a bundle at output (written atomically); returns the entry names"""
+    import hashlib
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process name so concurrent builds don't write into each other's file
+    tmp_path = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    strings = {}
+
+    def intern_string(value):
+        sid = strings.get(value)
+        if sid is None:
+            sid = strings[value] = len(strings)
+        return sid
+
+    entries = {}
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, 0, 0))
+            writer = _Writer(f)
+            for filepath, search_cols, output_cols in sources or bundle_sources():
+                st = filepath.stat()
+                raw = filepath.read_bytes()
+                index = _build_index(raw, search_cols, output_cols)
+                entry = _index_sections(writer, index, intern_string)
+                entry.update({
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "sha256": hashlib.sha256(raw).hexdigest(),
+                    "search_cols": list(search_cols),
+                    "output_cols": list(output_cols),
+                })
+                entries[_index_name(filepath)] = entry
+
+            string_offsets = array("I", [0])
+            blob = bytearray()
+            for value in strings:
+                blob += value.encode("utf-8")
+                string_offsets.append(len(blob))
+            directory = marshal.dumps({
+                "version": BUNDLE_VERSION,
+                "byteorder": sys.byteorder,
+                "strings": (writer.section(string_offsets.tobytes()), len(strings), writer.section(bytes(blob))),
+                "entries": entries,
+            })
+            directory_offset = writer.section(directory)
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, directory_offset, len(directory)))
+        tmp_path.replace(output)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return list(entries)
+
+
+# ============ READER ============
+class _StringTable:
+    def __init__(self, view, offsets_pos, count, blob_pos):
+        self.offsets = view[offsets_pos:offsets_pos + 4 * (count + 1)].cast("I")
+        self.blob = view[blob_pos:]
+
+    def bytes(self, sid):
+        return bytes(self.blob[self.offsets[sid]:self.offsets[sid + 1]])
+
+    def __getitem__(self, sid):
+        if sid == NO_VALUE:
+            return None
+        return str(self.blob[self.offsets[sid]:self.offsets[sid + 1]], "utf-8")
+
+
+class _TermDictionary:
+    """Sorted term ids with binary search; term i owns postings offsets[i]:offsets[i + 1]"""
+
+    def __init__(self, view, strings, entry):
+        def array_at(key, typecode, count):
+            start = entry[key]
+            return view[start:start + count * (8 if typecode == "d" else 4)].cast(typecode)
+
+        terms_pos, count = entry["terms"]
+        self.strings = strings
+        self.count = count
+        self.term_ids = view[terms_pos:terms_pos + 4 * count].cast("I")
+        self.idf = array_at("idf", "d", count)
+        self.max_scores = array_at("max_scores", "d", count)
+        self.offsets = array_at("offsets", "I", count + 1)
+        total = self.offsets[count]
+        self.docs = array_at("docs", "I", total)
+        self.tfs = array_at("tfs", "I", total)
+
+    def find(self, term):
+        """Position of term in the dictionary, or -1"""
+        key = term.encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.strings.bytes(self.term_ids[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self.strings.bytes(self.term_ids[lo]) == key:
+            return lo
+        return -1
+
+    def term(self, i):
+        return self.strings[self.term_ids[i]]
+
+    def postings(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return list(zip(self.docs[start:end], self.tfs[start:end]))
+
+
+class _TermMap:
+    """Read-only {term: value} view over the term dictionary (what BM25 expects of idf/postings)"""
+
+    def __init__(self, terms, value):
+        self._terms = terms
+        self._value = value
+
+    def get(self, term, default=None):
+        i = self._terms.find(term)
+        return default if i < 0 else self._value(i)
+
+    def __getitem__(self, term):
+        i = self._terms.find(term)
+        if i < 0:
+            raise KeyError(term)
+        return self._value(i)
+
+    def __contains__(self, term):
+        return self._terms.find(term) >= 0
+
+    def __len__(self):
+        return self._terms.count
+
+    def __iter__(self):
+        return (self._terms.term(i) for i in range(self._terms.count))
+
+    def items(self):
+        return ((self._terms.term(i), self._value(i)) for i in range(self._terms.count))
+
+
+class MappedBM25(BM25):
+    """BM25 whose postings, IDF and norms are read from the bundle mapping on demand.
+
+    Scoring is inherited unchanged. core never calls appended() on it: a
+    bundle payload is not passed to _load_index_uncached as the previous index,
+    so rows appended to the CSV are indexed from the cached index or the CSV.
+    """
+
+    def __init__(self, view, strings, entry):
+        super().__init__(entry["k1"], entry["b"])
+        terms = _TermDictionary(view, strings, entry)
+        self.N = entry["N"]
+        self.avgdl = entry["avgdl"]
+        self.idf = _TermMap(terms, terms.idf.__getitem__)
+        self.max_scores = _TermMap(terms, terms.max_scores.__getitem__)
+        self.postings = _TermMap(terms, terms.postings)
+        self.doc_norms = view[entry["doc_norms"]:entry["doc_norms"] + 8 * self.N].cast("d")
+
+    def iter_postings(self):
+        terms = self.postings._terms
+        for i in range(terms.count):
+            yield terms.term(i), terms.idf[i], terms.postings(i)
+
+
+class BundleIndex:
+    """SearchIndex counterpart over the bundle: rows are decoded from string ids on demand"""
+
+    def __init__(self, view, strings, entry):
+        self.columns = tuple(entry["columns"])
+        self.header = tuple(entry["header"])
+        self.bm25 = MappedBM25(view, strings, entry)
+        self._strings = strings
+        count = len(self.columns) * self.bm25.N
+        self._rows = view[entry["rows"]:entry["rows"] + 4 * count].cast("I")
+
+    def __len__(self):
+        return self.bm25.N
+
+    def row(self, idx):
+        """Materialize one row as {output column: value}"""
+        n = self.bm25.N
+        return {col: self._strings[self._rows[c * n + idx]] for c, col in enumerate(self.columns)}
+
+    def merged(self):
+        return self
+
+
+class Bundle:
+    """A read-only mapping of a compiled bundle file"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, directory_offset, directory_length = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"Not a ui-ux-pro-max bundle: {path}")
+        directory = marshal.loads(self._mmap[directory_offset:directory_offset + directory_length])
+        if directory.get("version") != BUNDLE_VERSION or directory.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Incompatible bundle, rebuild it: {path}")
+        view = memoryview(self._mmap)
+        self._view = view
+        self.strings = _StringTable(view, *directory["strings"])
+        self.entries = directory["entries"]
+
+    def entry(self, name):
+        """Directory entry (source fingerprint, columns, section offsets) for a CSV name"""
+        return self.entries.get(name)
+
+    def index(self, name):
+        return BundleIndex(self._view, self.strings, self.entries[name])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile the UI Pro Max CSVs into a memory-mapped bundle")
+    parser.add_argument("--output", "-o", type=Path, default=BUNDLE_PATH, help=f"Bundle path (default: {BUNDLE_PATH})")
+    args = parser.parse_args()
+
+    names = build_bundle(args.output)
+    print(f"Wrote {len(names)} indexes to {args.output}")
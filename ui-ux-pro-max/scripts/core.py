@@ -4,15 +4,39 @@
 UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
-import csv
+import heapq
+# Index caches are marshal files: marshal is built in, so loading one costs no import
+import marshal
+import os
 import re
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 
 # ============ CONFIGURATION ============
-DATA_DIR = Path(__file__).parent.parent / "data"
+# Both directories can be redirected (e.g. to synthetic benchmark data) through the environment
+DATA_DIR = Path(os.environ.get("UI_UX_PRO_MAX_DATA_DIR") or Path(__file__).parent.parent / "data")
+CACHE_DIR = Path(os.environ.get("UI_UX_PRO_MAX_CACHE_DIR") or Path(__file__).parent.parent / ".cache") / "index"
+# Memory-mapped index bundle compiled from the CSVs by bundle.py (optional)
+BUNDLE_PATH = Path(os.environ.get("UI_UX_PRO_MAX_BUNDLE") or CACHE_DIR.parent / "data.bundle")
+INDEX_VERSION = 8
 MAX_RESULTS = 3
+# Distinct queries whose tokens are memoized (agents repeat the same lookups a lot)
+QUERY_CACHE_SIZE = 1024
+# Full ranked lists kept so paging through a query's results doesn't rescore the corpus
+RANKED_CACHE_SIZE = 256
+# Upper bound on the dense (queries x documents) score block used by batched NumPy scoring
+BATCH_SCORE_CELLS = 1 << 22
+# Top-k queries touching fewer postings than this are scored exhaustively (pruning wouldn't pay off)
+PRUNE_MIN_POSTINGS = 2048
+# Relative slack on pruning thresholds so float rounding can never drop a true top-k document
+_PRUNE_SLACK = 1e-9
 
 CSV_CONFIG = {
     "style": {
@@ -84,6 +108,141 @@ _STACK_COLS = {
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
+_NUMPY = None
+
+
+def _numpy():
+    """Import NumPy on first use; returns None when it is not installed"""
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _NUMPY = numpy
+    return _NUMPY or None
+
+
+# ============ PROFILING ============
+class Profile:
+    """Per-phase wall/CPU timings, counters and index sizes for the work run inside it.
+
+    Use as a context manager; searches (and worker tasks started in a copied
+    context) record into it. Phases may nest, e.g. parse and fit run inside load.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = defaultdict(int)
+        self.indexes = {}
+        self.wall = self.cpu = 0.0
+        self._lock = threading.Lock()
+        self._token = None
+
+    def __enter__(self):
+        self._token = _PROFILE.set(self)
+        self._start = (time.perf_counter(), time.process_time())
+        return self
+
+    def __exit__(self, *exc):
+        self.wall = time.perf_counter() - self._start[0]
+        self.cpu = time.process_time() - self._start[1]
+        _PROFILE.reset(self._token)
+
+    def add(self, name, wall, cpu):
+        with self._lock:
+            totals = self.phases.setdefault(name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] += cpu
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def index(self, name, index):
+        bm25 = index.bm25
+        with self._lock:
+            self.indexes[name] = {"docs": bm25.N, "terms": len(bm25.idf), "segments": 1 + len(bm25.deltas)}
+
+    def to_dict(self):
+        """JSON-ready summary; times are in milliseconds"""
+        return {
+            "wall_ms": self.wall * 1000,
+            "cpu_ms": self.cpu * 1000,
+            "phases": {
+                name: {"calls": calls, "wall_ms": wall * 1000, "cpu_ms": cpu * 1000}
+                for name, (calls, wall, cpu) in self.phases.items()
+            },
+            "counters": dict(self.counters),
+            "indexes": dict(self.indexes),
+        }
+
+
+class _Phase:
+    __slots__ = ("profile", "name", "wall", "cpu")
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+
+    def __exit__(self, *exc):
+        self.profile.add(self.name, time.perf_counter() - self.wall, time.thread_time() - self.cpu)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_PROFILE = ContextVar("ui_ux_pro_max_profile", default=None)
+_NO_PHASE = _NoPhase()
+
+
+def phase(name):
+    """Time a block into the active Profile; a shared no-op when not profiling"""
+    profile = _PROFILE.get()
+    return _NO_PHASE if profile is None else _Phase(profile, name)
+
+
+def count(name, value=1):
+    """Add to a counter of the active Profile; nothing when not profiling"""
+    profile = _PROFILE.get()
+    if profile is not None:
+        profile.count(name, value)
+
+
+def run_profiled(fn, *args, **kwargs):
+    """Call fn under a fresh Profile; returns (result, profile dict)"""
+    with Profile() as profile:
+        result = fn(*args, **kwargs)
+    return result, profile.to_dict()
+
+
+# ============ TOKENIZER ============
+_NON_WORD = re.compile(r'[^\w\s]')
+
+
+def tokenize(text):
+    """Lowercase, split, remove punctuation, filter short words; tokens are interned"""
+    text = _NON_WORD.sub(' ', str(text).lower())
+    return [sys.intern(w) for w in text.split() if len(w) > 2]
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def tokenize_query(query):
+    """Memoized tokenization for queries, shared by every index"""
+    return tuple(tokenize(query))
+
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
@@ -92,119 +251,920 @@ class BM25:
     def __init__(self, k1=1.5, b=0.75):
         self.k1 = k1
         self.b = b
-        self.corpus = []
         self.doc_lengths = []
+        self.doc_norms = []
         self.avgdl = 0
         self.idf = {}
+        # Per-term upper bound of a document's score contribution, for top-k pruning
+        self.max_scores = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}
+        # Postings of rows appended since the last merge, one dict per segment
+        self.deltas = []
         self.N = 0
+        self._weights = None
+
+    def __getstate__(self):
+        # The weight matrix is derived from the postings; rebuild it on demand after loading.
+        # Plain dicts only, so the state can be stored with marshal
+        state = self.__dict__.copy()
+        state["_weights"] = None
+        state["doc_freqs"] = dict(self.doc_freqs)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.doc_freqs = defaultdict(int, self.doc_freqs)
 
-    def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+    tokenize = staticmethod(tokenize)
 
     def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        """Build BM25 inverted index (term -> [(doc_id, tf), ...]) from documents
+
+        A document is a text or a sequence of cell texts (one per search column).
+        """
+        with phase("tokenize"):
+            corpus = self._tokenize_documents(documents)
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
-        self.avgdl = sum(self.doc_lengths) / self.N
+        with phase("fit"):
+            self.doc_lengths = [len(doc) for doc in corpus]
+            self.postings = self._invert(corpus, 0)
+            for word, doc_postings in self.postings.items():
+                self.doc_freqs[word] = len(doc_postings)
+            self._refresh_stats()
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+    def appended(self, documents):
+        """Copy of this index with documents added as a new delta segment
 
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+        Only the new documents are tokenized; their terms bump the document
+        frequencies, then IDF and length norms are re-derived because N and
+        avgdl moved. Existing postings are shared with this index, not copied.
+        """
+        with phase("tokenize"):
+            corpus = self._tokenize_documents(documents)
+        if not corpus:
+            return self
+        with phase("fit"):
+            return self._extended(corpus)
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+    def _extended(self, corpus):
+        extended = self._copy()
+        postings = self._invert(corpus, self.N)
+        extended.deltas = self.deltas + [postings]
+        extended.doc_freqs = defaultdict(int, self.doc_freqs)
+        for word, doc_postings in postings.items():
+            extended.doc_freqs[word] += len(doc_postings)
+        extended.N = self.N + len(corpus)
+        extended.doc_lengths = self.doc_lengths + [len(doc) for doc in corpus]
+        extended._refresh_stats()
+        return extended
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
+    def merged(self):
+        """Copy of this index with every delta segment folded into the base postings"""
+        if not self.deltas:
+            return self
+        merged = self._copy()
+        postings = dict(self.postings)
+        for delta_postings in self.deltas:
+            # Delta doc ids are all higher, so concatenating keeps every posting list sorted
+            for word, doc_postings in delta_postings.items():
+                postings[word] = postings.get(word, []) + doc_postings
+        merged.postings, merged.deltas = postings, []
+        return merged
+
+    def segments(self):
+        """Postings of the base index followed by each delta segment"""
+        return [self.postings] + self.deltas
+
+    def term_postings(self, term):
+        """All (doc_id, tf) postings for a term across segments, in doc id order"""
+        if not self.deltas:
+            return self.postings.get(term, [])
+        return [posting for postings in self.segments() for posting in postings.get(term, ())]
+
+    def iter_postings(self):
+        """(term, idf, postings) for every term, for whole-index passes"""
+        for term, idf in self.idf.items():
+            yield term, idf, self.term_postings(term)
+
+    def _copy(self):
+        clone = object.__new__(type(self))
+        clone.__dict__ = self.__dict__.copy()
+        clone._weights = None
+        return clone
+
+    def _tokenize_documents(self, documents):
+        """Token list of each document, tokenizing a sequence of cell texts cell by cell"""
+        # Cells repeat a lot (types, severities, platforms); tokenize each distinct text once
+        seen = {}
+
+        def tokenize_cell(text):
+            tokens = seen.get(text)
+            if tokens is None:
+                tokens = seen[text] = self.tokenize(text)
+            return tokens
+
+        corpus = []
+        for doc in documents:
+            if isinstance(doc, str):
+                corpus.append(tokenize_cell(doc))
+            else:
+                corpus.append([token for text in doc for token in tokenize_cell(text)])
+        return corpus
+
+    @staticmethod
+    def _invert(corpus, offset):
+        """Postings for token lists numbered from offset"""
+        postings = defaultdict(list)
+        for doc_id, doc in enumerate(corpus, offset):
             term_freqs = defaultdict(int)
             for word in doc:
                 term_freqs[word] += 1
+            for word, tf in term_freqs.items():
+                postings[word].append((doc_id, tf))
+        return dict(postings)
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    def _refresh_stats(self):
+        """Derive avgdl, length norms and IDF from N, the document lengths and the df counts"""
+        self.avgdl = sum(self.doc_lengths) / self.N
+        # Length normalisation is per document, so compute it once here instead of per query
+        self.doc_norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
+        self.idf = {word: log((self.N - freq + 0.5) / (freq + 0.5) + 1) for word, freq in self.doc_freqs.items()}
+        k1_plus_1 = self.k1 + 1
+        doc_norms = self.doc_norms
+        self.max_scores = {}
+        for postings in self.segments():
+            for word, doc_postings in postings.items():
+                idf = self.idf[word]
+                bound = max(idf * (tf * k1_plus_1) / (tf + doc_norms[idx]) for idx, tf in doc_postings)
+                self.max_scores[word] = max(bound, self.max_scores.get(word, 0.0))
+        self._weights = None
 
-            scores.append((idx, score))
+    def score(self, query, top_k=None):
+        """Score documents sharing a term with the query, best first (optionally only top_k)"""
+        scores = defaultdict(float)
+        k1_plus_1 = self.k1 + 1
+        doc_norms = self.doc_norms
+        with phase("tokenize"):
+            tokens = tokenize_query(query)
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+        if top_k is not None and top_k <= 0:
+            return []
 
+        with phase("score"):
+            term_postings = {token: self.term_postings(token) for token in set(tokens)}
+            if top_k is not None and sum(map(len, term_postings.values())) >= PRUNE_MIN_POSTINGS:
+                return self._score_top_k(tokens, term_postings, top_k)
+            for token in tokens:
+                doc_postings = term_postings[token]
+                if not doc_postings:
+                    continue
+                idf = self.idf[token]
+                for idx, tf in doc_postings:
+                    scores[idx] += idf * (tf * k1_plus_1) / (tf + doc_norms[idx])
+            count("candidates", len(scores))
+            return self._rank(scores, top_k)
+
+    def _score_top_k(self, tokens, term_postings, top_k):
+        """MaxScore-style top-k: stop admitting documents that can no longer reach the k-th best
+
+        Terms go by decreasing score upper bound. Once the bounds of the
+        remaining terms can't lift an unseen document past the k-th best
+        partial score, only the surviving candidates are updated (by binary
+        search into long posting lists). Candidates are finally rescored in
+        query order, so scores and ties match exhaustive scoring exactly.
+        """
+        k1_plus_1 = self.k1 + 1
+        doc_norms = self.doc_norms
+        multiplicity = defaultdict(int)
+        for token in tokens:
+            if term_postings[token]:
+                multiplicity[token] += 1
+        bounds = {term: self.max_scores[term] * repeats for term, repeats in multiplicity.items()}
+        terms = sorted(bounds, key=bounds.get, reverse=True)
+        remaining = [sum(bounds[term] for term in terms[i:]) for i in range(len(terms))]
+
+        scores = {}
+        for i, term in enumerate(terms):
+            doc_postings = term_postings[term]
+            weight = self.idf[term] * multiplicity[term]
+            threshold = 0.0
+            if len(scores) >= top_k:
+                threshold = heapq.nlargest(top_k, scores.values())[-1] * (1 - _PRUNE_SLACK)
+            if remaining[i] >= threshold:
+                for idx, tf in doc_postings:
+                    scores[idx] = scores.get(idx, 0.0) + weight * (tf * k1_plus_1) / (tf + doc_norms[idx])
+                continue
+            # No unseen document can make the top k: drop hopeless candidates, update the rest
+            scores = {idx: score for idx, score in scores.items() if score + remaining[i] >= threshold}
+            if len(scores) * 16 < len(doc_postings):
+                for idx in scores:
+                    tf = _posting_tf(doc_postings, idx)
+                    if tf:
+                        scores[idx] += weight * (tf * k1_plus_1) / (tf + doc_norms[idx])
+            else:
+                for idx, tf in doc_postings:
+                    if idx in scores:
+                        scores[idx] += weight * (tf * k1_plus_1) / (tf + doc_norms[idx])
+        count("candidates", len(scores))
+        if not scores:
+            return []
+
+        cutoff = heapq.nlargest(top_k, scores.values())[-1] * (1 - _PRUNE_SLACK)
+        exact = {}
+        for idx, score in scores.items():
+            if score < cutoff:
+                continue
+            total = 0.0
+            for token in tokens:
+                tf = _posting_tf(term_postings[token], idx)
+                if tf:
+                    total += self.idf[token] * (tf * k1_plus_1) / (tf + doc_norms[idx])
+            exact[idx] = total
+        return self._rank(exact, top_k)
+
+    @staticmethod
+    def _rank(scores, top_k):
+        """Order a {doc_id: score} map best first; ties keep corpus order like a stable sort"""
+        rank_key = lambda item: (item[1], -item[0])
+        if top_k is None:
+            return sorted(scores.items(), key=rank_key, reverse=True)
+        return heapq.nlargest(top_k, scores.items(), key=rank_key)
+
+    def weight_matrix(self):
+        """Sparse doc-term BM25 weights, term -> (doc_ids, weights), built once on demand"""
+        if self._weights is None:
+            np = _numpy()
+            k1_plus_1 = self.k1 + 1
+            weights = {}
+            for term, idf, doc_postings in self.iter_postings():
+                doc_ids = [idx for idx, _ in doc_postings]
+                term_weights = [idf * (tf * k1_plus_1) / (tf + self.doc_norms[idx]) for idx, tf in doc_postings]
+                if np is not None:
+                    weights[term] = (np.array(doc_ids, dtype=np.intp), np.array(term_weights, dtype=np.float64))
+                else:
+                    weights[term] = (doc_ids, term_weights)
+            self._weights = weights
+        return self._weights
+
+    def score_many(self, queries, top_k=None):
+        """Score a batch of queries against the weight matrix; one ranked list per query"""
+        with phase("tokenize"):
+            token_lists = [tokenize_query(query) for query in queries]
+        if self.N == 0:
+            return [[] for _ in token_lists]
+        with phase("score"):
+            weights = self.weight_matrix()
+            np = _numpy()
+            if np is not None:
+                return self._score_many_numpy(np, weights, token_lists, top_k)
+
+            ranked = []
+            for tokens in token_lists:
+                scores = defaultdict(float)
+                for token in tokens:
+                    doc_ids, term_weights = weights.get(token, ((), ()))
+                    for idx, weight in zip(doc_ids, term_weights):
+                        scores[idx] += weight
+                count("candidates", len(scores))
+                ranked.append(self._rank(scores, top_k))
+            return ranked
+
+    def _score_many_numpy(self, np, weights, token_lists, top_k):
+        """Batch scoring as (query x term) counts times the sparse (term x doc) weights"""
+        vocab = {}
+        rows, cols = [], []
+        for qi, tokens in enumerate(token_lists):
+            for token in tokens:
+                if token in weights:
+                    rows.append(qi)
+                    cols.append(vocab.setdefault(token, len(vocab)))
+        ranked = [[] for _ in token_lists]
+        if not vocab:
+            return ranked
+
+        counts = np.zeros((len(token_lists), len(vocab)))
+        np.add.at(counts, (rows, cols), 1)
+
+        # Score in blocks of queries so the dense score block stays bounded on large corpora
+        block_size = max(1, BATCH_SCORE_CELLS // self.N)
+        for start in range(0, len(token_lists), block_size):
+            block = counts[start:start + block_size]
+            scores = np.zeros((block.shape[0], self.N))
+            for term, col in vocab.items():
+                query_ids = np.flatnonzero(block[:, col])
+                if not query_ids.size:
+                    continue
+                doc_ids, term_weights = weights[term]
+                scores[np.ix_(query_ids, doc_ids)] += block[query_ids, col, None] * term_weights
+            for offset, row in enumerate(scores):
+                ranked[start + offset] = self._top_k_dense(np, row, top_k)
+        return ranked
+
+    @staticmethod
+    def _top_k_dense(np, row, top_k):
+        """Top-k (doc_id, score) pairs with score > 0 from a dense score row"""
+        doc_ids = np.flatnonzero(row > 0)
+        if top_k is not None and doc_ids.size > top_k:
+            if top_k <= 0:
+                return []
+            cut = doc_ids.size - top_k
+            kth = np.partition(row[doc_ids], cut)[cut]
+            doc_ids = doc_ids[row[doc_ids] >= kth]
+        # Best score first, ties in corpus order
+        doc_ids = doc_ids[np.lexsort((doc_ids, -row[doc_ids]))][:top_k]
+        return [(int(idx), float(row[idx])) for idx in doc_ids]
+
+
+# ============ INDEX CACHE ============
+def _posting_tf(doc_postings, idx):
+    """Term frequency of document idx in a doc-id sorted posting list (0 if absent)"""
+    pos = bisect_left(doc_postings, (idx,))
+    if pos < len(doc_postings) and doc_postings[pos][0] == idx:
+        return doc_postings[pos][1]
+    return 0
+
+
+class SearchIndex:
+    """Fitted BM25 index plus a columnar store holding only the output columns.
+
+    Each column is a tuple of interned cell values; rows are materialized as
+    dicts only for the final top-k results.
+    """
+
+    def __init__(self, columns, values, bm25, header=()):
+        self.columns = tuple(columns)
+        self.values = tuple(values)
+        self.bm25 = bm25
+        # CSV header the index was built from, needed to parse appended rows
+        self.header = tuple(header)
+
+    def __len__(self):
+        return self.bm25.N
+
+    def row(self, idx):
+        """Materialize one row as {output column: value}"""
+        return {col: column_values[idx] for col, column_values in zip(self.columns, self.values)}
+
+    def appended(self, documents, values):
+        """Copy of this index with extra rows, indexed as a BM25 delta segment"""
+        if not documents:
+            return self
+        columns = [old + tuple(new) for old, new in zip(self.values, values)]
+        return SearchIndex(self.columns, columns, self.bm25.appended(documents), self.header)
+
+    def merged(self):
+        """Copy of this index with its delta segments merged into the base postings"""
+        if not self.bm25.deltas:
+            return self
+        return SearchIndex(self.columns, self.values, self.bm25.merged(), self.header)
+
+    def to_state(self):
+        """Plain tuples and dicts describing this index, for the marshal cache"""
+        return (self.columns, self.values, self.header, self.bm25.__getstate__())
+
+    @classmethod
+    def from_state(cls, state):
+        columns, values, header, bm25_state = state
+        bm25 = object.__new__(BM25)
+        bm25.__setstate__(bm25_state)
+        return cls(columns, values, bm25, header)
+
+
+# (filepath, search_cols, output_cols) -> ((size, mtime_ns), payload) for indexes already loaded in this process
+_INDEXES = {}
+# One lock per index so concurrent searches share a single load without serialising other domains
+_INDEX_LOCKS = defaultdict(threading.Lock)
+_INDEX_LOCKS_GUARD = threading.Lock()
+
+
+def _file_stat(filepath):
+    """Return the (size, mtime_ns) pair used as the cheap staleness check"""
+    st = filepath.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _cache_path(filepath):
+    """Location of the persisted index for a CSV under DATA_DIR"""
+    try:
+        name = filepath.resolve().relative_to(DATA_DIR.resolve()).as_posix()
+    except ValueError:
+        import hashlib
+        name = hashlib.sha256(str(filepath.resolve()).encode("utf-8")).hexdigest()[:16] + "-" + filepath.name
+    return CACHE_DIR / (name.replace("/", "__") + ".marshal")
+
+
+def _read_cached_index(cache_path):
+    """Read a persisted payload, or None if missing/unreadable"""
+    try:
+        # One read and marshal.loads: marshal.load on a file object calls back into it per value
+        with open(cache_path, 'rb') as f, phase("read_cache"):
+            payload = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+        return None
+    return payload
+
+
+def _write_cached_index(cache_path, payload):
+    """Persist a payload of plain values atomically; a read-only install just skips caching"""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps(payload))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _csv_reader(raw):
+    # csv is only needed when (re)building, not when a persisted index is loaded
+    import csv
+    import io
+    # newline=None gives the same universal-newline handling as reading the file in text mode
+    return csv.reader(io.StringIO(raw.decode('utf-8'), newline=None))
+
+
+def _parse_records(reader, header, search_cols, columns):
+    """Search documents and output column values for the CSV records left in reader"""
+    # Same lookups as csv.DictReader: last duplicate header wins, short rows read as None
+    positions = {name: i for i, name in enumerate(header)}
+    search_positions = [positions.get(col) for col in search_cols]
+    output_positions = [positions[col] for col in columns]
+
+    documents = []
+    values = [[] for _ in columns]
+    for record in reader:
+        if not record:
+            continue
+        width = len(record)
+        # Build documents from search columns, one text per cell
+        documents.append(tuple(
+            "" if pos is None else str(record[pos] if pos < width else None) for pos in search_positions
+        ))
+        for column_values, pos in zip(values, output_positions):
+            column_values.append(sys.intern(record[pos]) if pos < width else None)
+    return documents, values
+
+
+def _build_index(raw, search_cols, output_cols):
+    """Parse CSV bytes, fit BM25 over the search columns and keep only the output columns"""
+    with phase("parse"):
+        reader = _csv_reader(raw)
+        header = next(reader, [])
+        columns = [col for col in output_cols if col in header]
+        documents, values = _parse_records(reader, header, search_cols, columns)
+
+    bm25 = BM25()
+    bm25.fit(documents)
+    return SearchIndex(columns, [tuple(column_values) for column_values in values], bm25, header)
+
+
+def _appended_tail(raw, payload):
+    """Bytes added after the previously indexed content, or None if the file was edited otherwise"""
+    import hashlib
+    size = payload["size"]
+    if not 0 < size < len(raw):
+        return None
+    # Only a clean append after a complete last record can be indexed as a delta: the old content
+    # ends its last line, or (for a file saved without a final newline) the new content starts
+    # one, and no quoted field is left open
+    if raw[size - 1:size] != b"\n" and not raw.startswith((b"\n", b"\r\n"), size):
+        return None
+    if raw.count(b'"', 0, size) % 2:
+        return None
+    if hashlib.sha256(raw[:size]).hexdigest() != payload["sha256"]:
+        return None
+    return raw[size:]
+
+
+def _load_index_uncached(filepath, search_cols, output_cols, stat, previous=None):
+    """Load the persisted index payload for a CSV, rebuilding it only when the source changed
+
+    previous is the payload already loaded in this process, if any; rows
+    appended since it (or since the persisted one) are indexed as a delta
+    segment on top of it instead of rebuilding.
+    """
+    cache_path = _cache_path(filepath)
+    payload = previous
+    if payload is None:
+        payload = _bundle_payload(filepath, search_cols, output_cols, stat)
+        if payload is not None:
+            return payload
+        payload = _read_cached_index(cache_path)
+        if payload is not None and (payload.get("search_cols"), payload.get("output_cols")) != (list(search_cols), list(output_cols)):
+            payload = None
+        if payload is not None:
+            payload["index"] = SearchIndex.from_state(payload["index"])
+            if (payload["size"], payload["mtime_ns"]) == stat:
+                return payload
+
+    import hashlib
+    raw = filepath.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    tail = _appended_tail(raw, payload) if payload is not None else None
+
+    if payload is not None and payload["sha256"] == digest:
+        # Touched but not edited: keep the index, refresh the stat fingerprint
+        index = payload["index"]
+    elif tail is not None:
+        # Rows were appended: index just the new rows as a delta segment
+        index = payload["index"]
+        with phase("parse"):
+            documents, values = _parse_records(_csv_reader(tail), index.header, search_cols, index.columns)
+        index = index.appended(documents, values)
+    else:
+        index = _build_index(raw, search_cols, output_cols)
+
+    payload = {
+        "version": INDEX_VERSION,
+        "search_cols": list(search_cols),
+        "output_cols": list(output_cols),
+        "size": stat[0],
+        "mtime_ns": stat[1],
+        "sha256": digest,
+        "index": index,
+    }
+    if not index.bm25.deltas:
+        # A segmented index is persisted by _merge_segments once merged, off the request path
+        _write_cached_index(cache_path, dict(payload, index=index.to_state()))
+    return payload
+
+
+_BUNDLE = None
+_BUNDLE_LOCK = threading.Lock()
 
-# ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
 
+def _bundle():
+    """The mapped bundle at BUNDLE_PATH, or None when there is none (or it is unreadable)"""
+    global _BUNDLE
+    with _BUNDLE_LOCK:
+        if _BUNDLE is None:
+            _BUNDLE = False
+            if BUNDLE_PATH.exists():
+                from bundle import Bundle
+                try:
+                    with phase("bundle_open"):
+                        _BUNDLE = Bundle(BUNDLE_PATH)
+                except (OSError, ValueError, EOFError, TypeError):
+                    pass
+        return _BUNDLE or None
 
+
+def _bundle_payload(filepath, search_cols, output_cols, stat):
+    """Index payload served from the bundle, or None if the bundle lacks this CSV or it is stale"""
+    bundle = _bundle()
+    if bundle is None:
+        return None
+    name = _index_name(filepath)
+    entry = bundle.entry(name)
+    if entry is None or (entry["search_cols"], entry["output_cols"]) != (list(search_cols), list(output_cols)):
+        return None
+    if (entry["size"], entry["mtime_ns"]) != stat:
+        # Checkouts reset mtimes; only a content change makes the bundle entry stale
+        import hashlib
+        if hashlib.sha256(filepath.read_bytes()).hexdigest() != entry["sha256"]:
+            return None
+    return {
+        "size": stat[0],
+        "mtime_ns": stat[1],
+        "sha256": entry["sha256"],
+        "index": bundle.index(name),
+        "bundle": True,
+    }
+
+
+def _index_lock(key):
+    with _INDEX_LOCKS_GUARD:
+        return _INDEX_LOCKS[key]
+
+
+def _merge_segments(cache_path, key, payload):
+    """Fold an index's delta segments into its base postings, then swap it in and persist it"""
+    merged = dict(payload, index=payload["index"].merged())
+    with _index_lock(key):
+        cached = _INDEXES.get(key)
+        # Skip if the CSV changed again and a newer index replaced this one meanwhile
+        if cached is None or cached[1] is not payload:
+            return
+        _INDEXES[key] = (cached[0], merged)
+        _write_cached_index(cache_path, dict(merged, index=merged["index"].to_state()))
+
+
+def load_index(filepath, search_cols, output_cols):
+    """Return a ready SearchIndex for a CSV, from memory, disk cache or a fresh build"""
+    filepath = Path(filepath)
+    stat = _file_stat(filepath)
+    key = (str(filepath), tuple(search_cols), tuple(output_cols))
+
+    cached = _INDEXES.get(key)
+    if cached is not None and cached[0] == stat:
+        index = cached[1]["index"]
+    else:
+        index = _reload_index(filepath, search_cols, output_cols, stat, key)
+
+    profile = _PROFILE.get()
+    if profile is not None:
+        profile.index(_index_name(filepath), index)
+    return index
+
+
+def _reload_index(filepath, search_cols, output_cols, stat, key):
+    with _index_lock(key), phase("load"):
+        cached = _INDEXES.get(key)
+        if cached is not None and cached[0] == stat:
+            return cached[1]["index"]
+        # Bundle indexes are read-only, so appends are indexed from the persisted/CSV index instead
+        previous = cached[1] if cached is not None and not cached[1].get("bundle") else None
+        payload = _load_index_uncached(filepath, search_cols, output_cols, stat, previous)
+        index = payload["index"]
+        _INDEXES[key] = (stat, payload)
+
+    if index.bm25.deltas:
+        # Serve the segmented index now; merging and re-persisting happen off the request path
+        threading.Thread(
+            target=_merge_segments, args=(_cache_path(filepath), key, payload), name="ui-ux-pro-max-merge"
+        ).start()
+    return index
+
+
+def _index_name(filepath):
+    """Short name of a CSV for reports: its path under DATA_DIR when possible"""
+    try:
+        return filepath.resolve().relative_to(DATA_DIR.resolve()).as_posix()
+    except ValueError:
+        return str(filepath)
+
+
+def warm_indexes():
+    """Load every domain and stack index into memory (used by long-lived servers)"""
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            load_index(filepath, config["search_cols"], config["output_cols"])
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            load_index(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"])
+
+
+# ============ FACETED INDEX ============
+@lru_cache(maxsize=None)
+def _facet_posting():
+    """Layout of a merged posting: facet number, doc id within the facet, precomputed BM25 weight"""
+    import struct
+    return struct.Struct("<HId")
+
+
+class FacetedIndex:
+    """Several indexes merged into one posting map, each posting tagged with its facet.
+
+    Weights keep each facet's own IDF and length normalisation, so per-facet
+    rankings match searching that facet alone. Each term's postings are packed
+    bytes, so the merged map is persisted and loads in one small read; a
+    facet's own index is only loaded when rows are taken from it.
+    """
+
+    def __init__(self, sources, postings):
+        # sources: (name, filepath, search_cols, output_cols) per facet
+        self.sources = sources
+        self.names = [source[0] for source in sources]
+        self.postings = postings
+
+    @classmethod
+    def build(cls, sources):
+        posting = _facet_posting()
+        postings = defaultdict(bytearray)
+        for facet, (_, filepath, search_cols, output_cols) in enumerate(sources):
+            bm25 = load_index(filepath, search_cols, output_cols).bm25
+            k1_plus_1 = bm25.k1 + 1
+            for term, idf, doc_postings in bm25.iter_postings():
+                packed = postings[term]
+                for idx, tf in doc_postings:
+                    packed += posting.pack(facet, idx, idf * (tf * k1_plus_1) / (tf + bm25.doc_norms[idx]))
+        return cls(sources, {term: bytes(packed) for term, packed in postings.items()})
+
+    def index(self, name):
+        """The SearchIndex of one facet"""
+        _, filepath, search_cols, output_cols = self.sources[self.names.index(name)]
+        return load_index(filepath, search_cols, output_cols)
+
+    def results(self, name, ranked):
+        """Output rows for a facet's ranked (doc_id, score) list"""
+        return _collect_results(self.index(name), ranked) if ranked else []
+
+    def score(self, query, top_k=None):
+        """Score all facets in one pass; returns {facet: [(doc_id, score), ...]} best first"""
+        unpack = _facet_posting().iter_unpack
+        scores = [defaultdict(float) for _ in self.names]
+        with phase("tokenize"):
+            tokens = tokenize_query(query)
+        with phase("score"):
+            for token in tokens:
+                for facet, idx, weight in unpack(self.postings.get(token, b"")):
+                    scores[facet][idx] += weight
+            count("candidates", sum(len(facet_scores) for facet_scores in scores))
+            return {name: BM25._rank(facet_scores, top_k) for name, facet_scores in zip(self.names, scores)}
+
+    @staticmethod
+    def best_facet(ranked):
+        """Facet holding the highest-scoring document, or None when nothing matched"""
+        best, best_score = None, 0
+        for name, facet_ranked in ranked.items():
+            if facet_ranked and facet_ranked[0][1] > best_score:
+                best, best_score = name, facet_ranked[0][1]
+        return best
+
+
+# kind -> (source CSV stats, FacetedIndex); merged again when any source CSV changes
+_FACETED = {}
+_FACETED_LOCK = threading.Lock()
+
+
+def _faceted_index(kind, sources):
+    """FacetedIndex over sources, from memory, the persisted merge or a fresh merge of their indexes"""
+    stats = [_file_stat(filepath) for _, filepath, _, _ in sources]
+    with _FACETED_LOCK:
+        cached = _FACETED.get(kind)
+        if cached is not None and cached[0] == stats:
+            return cached[1]
+        fingerprint = [
+            (name, str(filepath), list(search_cols), list(output_cols), stat)
+            for (name, filepath, search_cols, output_cols), stat in zip(sources, stats)
+        ]
+        cache_path = CACHE_DIR / f"{kind}-facets.marshal"
+        payload = _read_cached_index(cache_path)
+        if payload is not None and payload.get("sources") == fingerprint:
+            faceted = FacetedIndex(sources, payload["postings"])
+        else:
+            with phase("facet_build"):
+                faceted = FacetedIndex.build(sources)
+            _write_cached_index(cache_path, {"version": INDEX_VERSION, "sources": fingerprint, "postings": faceted.postings})
+        _FACETED[kind] = (stats, faceted)
+        return faceted
+
+
+def domain_index():
+    """Combined index over every CSV_CONFIG domain, faceted by domain"""
+    sources = [
+        (domain, DATA_DIR / config["file"], config["search_cols"], config["output_cols"])
+        for domain, config in CSV_CONFIG.items()
+    ]
+    return _faceted_index("domain", [source for source in sources if source[1].exists()])
+
+
+def stack_index():
+    """Combined index over every STACK_CONFIG file, faceted by stack"""
+    sources = [
+        (stack, DATA_DIR / config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"])
+        for stack, config in STACK_CONFIG.items()
+    ]
+    return _faceted_index("stack", [source for source in sources if source[1].exists()])
+
+
+# ============ SEARCH FUNCTIONS ============
 def _search_csv(filepath, search_cols, output_cols, query, max_results):
     """Core search function using BM25"""
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
+    index = load_index(filepath, search_cols, output_cols)
+    return _collect_results(index, index.bm25.score(query, max_results))
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+def _collect_results(index, ranked):
+    """Materialize output rows for ranked (doc_id, score) pairs, keeping only matches"""
+    return [index.row(idx) for idx, score in ranked if score > 0]
+
+
+# ============ PAGINATION ============
+# (file, search_cols, query tokens) -> (SearchIndex, matches best first), least recently used first
+_RANKED = OrderedDict()
+_RANKED_LOCK = threading.Lock()
+
+
+def _ranked_matches(filepath, search_cols, output_cols, query):
+    """Every matching (doc_id, score) for a query, best first, cached per query and index"""
+    index = load_index(filepath, search_cols, output_cols)
+    key = (str(filepath), tuple(search_cols), tokenize_query(query))
+    with _RANKED_LOCK:
+        cached = _RANKED.get(key)
+        if cached is not None and cached[0] is index:
+            _RANKED.move_to_end(key)
+            return index, cached[1]
+
+    ranked = [(idx, score) for idx, score in index.bm25.score(query) if score > 0]
+    with _RANKED_LOCK:
+        _RANKED[key] = (index, ranked)
+        _RANKED.move_to_end(key)
+        while len(_RANKED) > RANKED_CACHE_SIZE:
+            _RANKED.popitem(last=False)
+    return index, ranked
+
+
+def _cursor_scope(*parts):
+    import hashlib
+    return hashlib.blake2s(repr(parts).encode("utf-8"), digest_size=4).hexdigest()
+
+
+def encode_cursor(offset, scope):
+    """Opaque cursor for the page starting at offset of one query's results"""
+    return f"{offset}.{scope}"
+
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+def decode_cursor(cursor, scope):
+    """Offset a cursor points at; ValueError if it is malformed or from another query"""
+    offset, _, cursor_scope = str(cursor).partition(".")
+    if not offset.isdigit() or cursor_scope != scope:
+        raise ValueError(f"Invalid cursor for this query: {cursor}")
+    return int(offset)
 
-    return results
+
+def _paged_search(filepath, search_cols, output_cols, query, max_results, offset, cursor, scope):
+    """One page of results plus {"offset", "total", "next_cursor"}; raises ValueError on a bad cursor"""
+    if cursor is not None:
+        offset = decode_cursor(cursor, scope)
+    offset = max(0, int(offset or 0))
+    index, ranked = _ranked_matches(filepath, search_cols, output_cols, query)
+    page = ranked[offset:offset + max_results]
+    next_offset = offset + len(page)
+    return _collect_results(index, page), {
+        "offset": offset,
+        "total": len(ranked),
+        "next_cursor": encode_cursor(next_offset, scope) if page and next_offset < len(ranked) else None,
+    }
+
+
+# Explicit intent words; a query naming one of these is routed to that domain
+_DOMAIN_HINTS = {
+    "color": ["color", "palette", "hex", "#", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"]
+}
+
+
+def _pick_domain(query, ranked):
+    """Choose a domain from intent words, letting BM25 evidence break ties and fill gaps"""
+    query_lower = query.lower()
+    hints = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in _DOMAIN_HINTS.items()}
+    top_hits = max(hints.values())
+    candidates = [domain for domain, hits in hints.items() if hits == top_hits] if top_hits else list(ranked)
+
+    best, best_score = None, 0
+    for domain in candidates:
+        domain_ranked = ranked.get(domain)
+        if domain_ranked and domain_ranked[0][1] > best_score:
+            best, best_score = domain, domain_ranked[0][1]
+    if best is not None:
+        return best
+    return candidates[0] if top_hits else "style"
 
 
 def detect_domain(query):
     """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
+    return _pick_domain(query, domain_index().score(query, 1))
+
 
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"]
+def _domain_response(domain, config, query, results):
+    """Result dict for a domain search"""
+    return {
+        "domain": domain,
+        "query": query,
+        "file": config["file"],
+        "count": len(results),
+        "results": results
     }
 
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
-    best = max(scores, key=scores.get)
-    return best if scores[best] > 0 else "style"
 
+def search(query, domain=None, max_results=MAX_RESULTS, offset=None, cursor=None):
+    """Main search function with auto-domain detection
 
-def search(query, domain=None, max_results=MAX_RESULTS):
-    """Main search function with auto-domain detection"""
-    if domain is None:
+    Passing offset or cursor returns that page of max_results plus "offset",
+    "total" and "next_cursor" (None on the last page).
+    """
+    paged = offset is not None or cursor is not None
+    if domain is None and paged:
         domain = detect_domain(query)
+    if domain is None:
+        # One scoring pass over every domain both picks the domain and ranks it
+        faceted = domain_index()
+        ranked = faceted.score(query, max_results)
+        domain = _pick_domain(query, ranked)
+        if domain in ranked:
+            return _domain_response(domain, CSV_CONFIG[domain], query, faceted.results(domain, ranked[domain]))
 
     config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
     filepath = DATA_DIR / config["file"]
@@ -212,19 +1172,71 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"File not found: {filepath}", "domain": domain}
 
+    if paged:
+        scope = _cursor_scope(domain, tokenize_query(query))
+        try:
+            results, page = _paged_search(
+                filepath, config["search_cols"], config["output_cols"], query, max_results, offset, cursor, scope
+            )
+        except ValueError as exc:
+            return {"error": str(exc), "domain": domain}
+        return dict(_domain_response(domain, config, query, results), **page)
+
     results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    return _domain_response(domain, config, query, results)
+
 
+def search_all(query, max_results=MAX_RESULTS):
+    """Search every domain in one scoring pass; returns per-domain top-k and the best domain"""
+    faceted = domain_index()
+    ranked = faceted.score(query, max_results)
+    domains = {
+        domain: _domain_response(domain, CSV_CONFIG[domain], query, faceted.results(domain, ranked[domain]))
+        for domain in faceted.names
+    }
     return {
-        "domain": domain,
+        "domain": _pick_domain(query, ranked),
         "query": query,
-        "file": config["file"],
+        "count": sum(result["count"] for result in domains.values()),
+        "domains": domains
+    }
+
+
+def _stack_response(stack, query, results):
+    return {
+        "domain": "stack",
+        "stack": stack,
+        "query": query,
+        "file": STACK_CONFIG[stack]["file"],
         "count": len(results),
         "results": results
     }
 
 
-def search_stack(query, stack, max_results=MAX_RESULTS):
-    """Search stack-specific guidelines"""
+def search_all_stacks(query, max_results=MAX_RESULTS):
+    """Search every stack in one scoring pass; returns per-stack top-k"""
+    faceted = stack_index()
+    ranked = faceted.score(query, max_results)
+    stacks = {stack: _stack_response(stack, query, faceted.results(stack, ranked[stack])) for stack in faceted.names}
+    return {
+        "domain": "stack",
+        "stack": "all",
+        "query": query,
+        "count": sum(result["count"] for result in stacks.values()),
+        "stacks": stacks
+    }
+
+
+def search_stack(query, stack, max_results=MAX_RESULTS, offset=None, cursor=None):
+    """Search stack-specific guidelines ("all" searches every stack at once)
+
+    offset/cursor page through the results like search().
+    """
+    paged = offset is not None or cursor is not None
+    if stack == "all":
+        if paged:
+            return {"error": "Paging is only available for a single stack", "stack": stack}
+        return search_all_stacks(query, max_results)
     if stack not in STACK_CONFIG:
         return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
 
@@ -233,13 +1245,43 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
+    if paged:
+        scope = _cursor_scope("stack", stack, tokenize_query(query))
+        try:
+            results, page = _paged_search(
+                filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results, offset, cursor, scope
+            )
+        except ValueError as exc:
+            return {"error": str(exc), "stack": stack}
+        return dict(_stack_response(stack, query, results), **page)
+
     results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    return _stack_response(stack, query, results)
 
-    return {
-        "domain": "stack",
-        "stack": stack,
-        "query": query,
-        "file": STACK_CONFIG[stack]["file"],
-        "count": len(results),
-        "results": results
-    }
+
+def search_many(queries, domain=None, max_results=MAX_RESULTS):
+    """Batch search: score many queries against a domain in one pass over its index"""
+    queries = list(queries)
+    domains = [domain if domain is not None else detect_domain(query) for query in queries]
+    responses = [None] * len(queries)
+
+    # Queries without an explicit domain may detect different ones; batch per domain
+    by_domain = defaultdict(list)
+    for position, query_domain in enumerate(domains):
+        by_domain[query_domain].append(position)
+
+    for query_domain, positions in by_domain.items():
+        config = CSV_CONFIG.get(query_domain, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            for position in positions:
+                responses[position] = {"error": f"File not found: {filepath}", "domain": query_domain}
+            continue
+
+        index = load_index(filepath, config["search_cols"], config["output_cols"])
+        batch = index.bm25.score_many([queries[position] for position in positions], max_results)
+        for position, ranked in zip(positions, batch):
+            results = _collect_results(index, ranked)
+            responses[position] = _domain_response(query_domain, config, queries[position], results)
+
+    return responses
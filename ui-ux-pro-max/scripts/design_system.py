@@ -11,8 +11,13 @@ Usage:
 
 import csv
 import json
+import os
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from contextvars import copy_context
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, search_many, CACHE_DIR, CSV_CONFIG, DATA_DIR, count, phase
 
 
 # ============ CONFIGURATION ============
@@ -26,6 +31,181 @@ SEARCH_CONFIG = {
     "typography": {"max_results": 2}
 }
 
+# Domains whose query depends on the product category found first
+DEPENDENT_DOMAINS = ("product", "style")
+
+# Formatted design systems kept in memory / on disk (least recently used evicted first)
+RESULT_CACHE_SIZE = 256
+RESULT_DISK_CACHE_SIZE = 1024
+# Extra disk entries allowed before an eviction pass lists the directory
+RESULT_DISK_CACHE_SLACK = 128
+# Part of every result cache key; bump when generation or formatting changes
+RESULT_CACHE_VERSION = 1
+RESULT_CACHE_DIR = CACHE_DIR.parent / "design-system"
+# UI_UX_PRO_MAX_RESULT_CACHE=memory keeps results in this process only
+RESULT_DISK_CACHE = os.environ.get("UI_UX_PRO_MAX_RESULT_CACHE", "disk") != "memory"
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool():
+    """Shared worker pool for per-domain searches (concurrent.futures is imported on first use)."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _POOL = ThreadPoolExecutor(max_workers=len(SEARCH_CONFIG), thread_name_prefix="design-system")
+        return _POOL
+
+
+def _submit(fn, *args):
+    """Run fn on the shared pool in a copy of the caller's context (keeps an active Profile)."""
+    return _get_pool().submit(copy_context().run, fn, *args)
+
+
+def _select_style(results: list, style_priority: list = None) -> dict:
+    """Earliest priority style named among the top results, else the top result.
+
+    The style query already carries the priority keywords, so when no result is
+    named after a priority the BM25 order is the keyword ranking.
+    """
+    if not results:
+        return {}
+    for priority in style_priority or []:
+        priority_lower = priority.lower().strip()
+        for result in results:
+            style_name = result.get("Style Category", "").lower()
+            if priority_lower in style_name or style_name in priority_lower:
+                return result
+    return results[0]
+
+
+def _domain_query(domain: str, query: str, style_priority: list = None) -> str:
+    """Query used for a domain; style also searches with the top priority keywords."""
+    if domain == "style" and style_priority:
+        return f"{query} {' '.join(style_priority[:2])}"
+    return query
+
+
+# ============ REASONING RULE MATCHER ============
+class _FirstMatchAutomaton:
+    """Aho-Corasick automaton that reports the lowest rule index whose pattern occurs in a text."""
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._first = [None]
+
+    def add(self, pattern: str, rule_index: int):
+        """Register a pattern for a rule; the earliest rule wins on shared patterns."""
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._first.append(None)
+            node = nxt
+        if self._first[node] is None or rule_index < self._first[node]:
+            self._first[node] = rule_index
+
+    def build(self):
+        """Compute failure links and fold each suffix's earliest rule into its node."""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0) if node else 0
+                inherited = self._first[self._fail[child]]
+                if inherited is not None and (self._first[child] is None or inherited < self._first[child]):
+                    self._first[child] = inherited
+                queue.append(child)
+
+    def first_match(self, text: str):
+        """Lowest rule index with a pattern occurring in text, or None."""
+        goto, fail, first = self._goto, self._fail, self._first
+        best = first[0]
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            found = first[node]
+            if found is not None and (best is None or found < best):
+                best = found
+        return best
+
+
+class ReasoningMatcher:
+    """Reasoning-rule lookup compiled once from ui-reasoning.csv rows.
+
+    Matching order is exact category, then substring in either direction,
+    then any category keyword; within a stage the earliest rule wins.
+    """
+
+    def __init__(self, rules: list):
+        self.rules = rules
+        self._exact = {}
+        self._contained = _FirstMatchAutomaton()
+        self._keywords = _FirstMatchAutomaton()
+        parts, self._starts = [], []
+        offset = 0
+
+        for i, rule in enumerate(rules):
+            ui_cat = rule.get("UI_Category", "").lower()
+            self._exact.setdefault(ui_cat, i)
+            self._contained.add(ui_cat, i)
+            for keyword in ui_cat.replace("/", " ").replace("-", " ").split():
+                self._keywords.add(keyword, i)
+            self._starts.append(offset)
+            parts.append(ui_cat)
+            offset += len(ui_cat) + 1
+
+        self._contained.build()
+        self._keywords.build()
+        # All categories joined, so "query inside a category" is one str.find
+        self._joined = "\0".join(parts)
+
+    def _first_containing(self, text: str):
+        """Lowest rule index whose category contains text, or None."""
+        if "\0" in text:
+            return None
+        pos = self._joined.find(text)
+        if pos < 0:
+            return None
+        return bisect_right(self._starts, pos) - 1
+
+    def find(self, category: str) -> dict:
+        """Find the matching reasoning rule for a category, or {}."""
+        if not self.rules:
+            return {}
+        category_lower = category.lower()
+
+        # Try exact match first
+        index = self._exact.get(category_lower)
+        if index is not None:
+            return self.rules[index]
+
+        # Try partial match
+        candidates = [
+            i for i in (self._contained.first_match(category_lower), self._first_containing(category_lower))
+            if i is not None
+        ]
+        if candidates:
+            return self.rules[min(candidates)]
+
+        # Try keyword match
+        index = self._keywords.first_match(category_lower)
+        if index is not None:
+            return self.rules[index]
+
+        return {}
+
 
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
@@ -33,6 +213,7 @@ class DesignSystemGenerator:
 
     def __init__(self):
         self.reasoning_data = self._load_reasoning()
+        self.reasoning_matcher = ReasoningMatcher(self.reasoning_data)
 
     def _load_reasoning(self) -> list:
         """Load reasoning rules from CSV."""
@@ -42,42 +223,9 @@ class DesignSystemGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             return list(csv.DictReader(f))
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
-
     def _find_reasoning_rule(self, category: str) -> dict:
         """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
-
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
+        return self.reasoning_matcher.find(category)
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
@@ -113,71 +261,79 @@ class DesignSystemGenerator:
             "severity": rule.get("Severity", "MEDIUM")
         }
 
-    def _select_best_match(self, results: list, priority_keywords: list) -> dict:
-        """Select best matching result based on priority keywords."""
-        if not results:
-            return {}
-
-        if not priority_keywords:
-            return results[0]
-
-        # First: try exact style name match
-        for priority in priority_keywords:
-            priority_lower = priority.lower().strip()
-            for result in results:
-                style_name = result.get("Style Category", "").lower()
-                if priority_lower in style_name or style_name in priority_lower:
-                    return result
-
-        # Second: score by keyword match in all fields
-        scored = []
-        for result in results:
-            result_str = str(result).lower()
-            score = 0
-            for kw in priority_keywords:
-                kw_lower = kw.lower().strip()
-                # Higher score for style name match
-                if kw_lower in result.get("Style Category", "").lower():
-                    score += 10
-                # Lower score for keyword field match
-                elif kw_lower in result.get("Keywords", "").lower():
-                    score += 3
-                # Even lower for other field matches
-                elif kw_lower in result_str:
-                    score += 1
-            scored.append((score, result))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return scored[0][1] if scored and scored[0][0] > 0 else results[0]
-
     def _extract_results(self, search_result: dict) -> list:
         """Extract results list from search result dict."""
         return search_result.get("results", [])
 
-    def generate(self, query: str, project_name: str = None) -> dict:
-        """Generate complete design system recommendation."""
-        # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+    def _category(self, product_result: dict) -> str:
+        """Product type of the top product match, used to pick reasoning rules."""
         product_results = product_result.get("results", [])
-        category = "General"
         if product_results:
-            category = product_results[0].get("Product Type", "General")
+            return product_results[0].get("Product Type", "General")
+        return "General"
+
+    def generate(self, query: str, project_name: str = None) -> dict:
+        """Generate complete design system recommendation."""
+        # Domains that don't depend on the product category start right away
+        pending = {
+            domain: _submit(search, query, domain, config["max_results"])
+            for domain, config in SEARCH_CONFIG.items() if domain not in DEPENDENT_DOMAINS
+        }
+
+        # Step 1: Search product to get category
+        product_result = search(query, "product", SEARCH_CONFIG["product"]["max_results"])
+        category = self._category(product_result)
 
         # Step 2: Get reasoning rules for this category
         reasoning = self._apply_reasoning(category, {})
         style_priority = reasoning.get("style_priority", [])
 
-        # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        # Step 3: Style search with priority hints, then collect the concurrent searches
+        search_results = {
+            "product": product_result,
+            "style": search(_domain_query("style", query, style_priority), "style", SEARCH_CONFIG["style"]["max_results"]),
+        }
+        search_results.update({domain: future.result() for domain, future in pending.items()})
+
+        return self._compose(query, project_name, category, reasoning, search_results)
+
+    def generate_many(self, queries: list, project_names: list = None) -> list:
+        """Generate design systems for many queries, batching each domain's searches."""
+        queries = list(queries)
+        if project_names is None:
+            project_names = [None] * len(queries)
 
-        # Step 4: Select best matches from each domain using priority
+        pending = {
+            domain: _submit(search_many, queries, domain, config["max_results"])
+            for domain, config in SEARCH_CONFIG.items() if domain not in DEPENDENT_DOMAINS
+        }
+
+        product_results = search_many(queries, "product", SEARCH_CONFIG["product"]["max_results"])
+        categories = [self._category(result) for result in product_results]
+        reasonings = [self._apply_reasoning(category, {}) for category in categories]
+        style_queries = [
+            _domain_query("style", query, reasoning.get("style_priority", []))
+            for query, reasoning in zip(queries, reasonings)
+        ]
+        style_results = search_many(style_queries, "style", SEARCH_CONFIG["style"]["max_results"])
+        batched = {domain: future.result() for domain, future in pending.items()}
+
+        design_systems = []
+        for i, query in enumerate(queries):
+            search_results = {"product": product_results[i], "style": style_results[i]}
+            search_results.update({domain: results[i] for domain, results in batched.items()})
+            design_systems.append(self._compose(query, project_names[i], categories[i], reasonings[i], search_results))
+        return design_systems
+
+    def _compose(self, query: str, project_name: str, category: str, reasoning: dict, search_results: dict) -> dict:
+        """Build the final recommendation from reasoning and per-domain results."""
+        # Step 4: Select best matches from each domain, the style by reasoning priority
         style_results = self._extract_results(search_results.get("style", {}))
         color_results = self._extract_results(search_results.get("color", {}))
         typography_results = self._extract_results(search_results.get("typography", {}))
         landing_results = self._extract_results(search_results.get("landing", {}))
 
-        best_style = self._select_best_match(style_results, reasoning.get("style_priority", []))
+        best_style = _select_style(style_results, reasoning.get("style_priority", []))
         best_color = color_results[0] if color_results else {}
         best_typography = typography_results[0] if typography_results else {}
         best_landing = landing_results[0] if landing_results else {}
@@ -426,7 +582,152 @@ def format_markdown(design_system: dict) -> str:
     return "\n".join(lines)
 
 
+# ============ RESULT CACHE ============
+class ResultCache:
+    """Size-bounded LRU of formatted design systems, optionally backed by files on disk.
+
+    Disk entries are one file per key; reads refresh the file's mtime. The
+    number of files is counted once and then tracked per write; when it passes
+    disk_maxsize + disk_slack the oldest mtimes are evicted down to disk_maxsize.
+    """
+
+    def __init__(self, maxsize: int = RESULT_CACHE_SIZE, directory: Path = None,
+                 disk_maxsize: int = RESULT_DISK_CACHE_SIZE, disk_slack: int = RESULT_DISK_CACHE_SLACK):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.disk_maxsize = disk_maxsize
+        self.disk_slack = disk_slack
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_count = None
+
+    def get(self, key: tuple):
+        """Cached value for key, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            value = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            return None
+        self._remember(key, value)
+        return value
+
+    def put(self, key: tuple, value: str):
+        """Store value under key in memory and, if enabled, on disk."""
+        self._remember(key, value)
+        if self.directory is not None:
+            self._store(key, value)
+
+    def clear(self):
+        """Forget the in-memory entries (disk entries expire with the data fingerprint)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: tuple, value: str):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: tuple) -> Path:
+        import hashlib
+        return self.directory / (hashlib.sha256(repr(key).encode("utf-8")).hexdigest() + ".txt")
+
+    def _store(self, key: tuple, value: str):
+        """Write one entry atomically and evict the least recently used files; failures just skip caching."""
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(value, encoding="utf-8")
+            added = not path.exists()
+            os.replace(tmp_path, path)
+            with self._lock:
+                if self._disk_count is None:
+                    self._disk_count = sum(1 for _ in self.directory.glob("*.txt"))
+                elif added:
+                    self._disk_count += 1
+                if self._disk_count > self.disk_maxsize + self.disk_slack:
+                    self._disk_count = self._evict()
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _evict(self) -> int:
+        """Delete the least recently used files beyond disk_maxsize; returns the number left."""
+        entries = []
+        for entry in self.directory.glob("*.txt"):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry))
+            except OSError:
+                pass  # removed by another process
+        entries.sort()
+        for _, entry in entries[:len(entries) - self.disk_maxsize]:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+        return min(len(entries), self.disk_maxsize)
+
+
+_RESULT_CACHE = ResultCache(directory=RESULT_CACHE_DIR if RESULT_DISK_CACHE else None)
+# CSVs a design system is generated from; their stats form the data version in cache keys
+_SOURCE_FILES = tuple(CSV_CONFIG[domain]["file"] for domain in SEARCH_CONFIG) + (REASONING_FILE,)
+
+
+def _normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query (searches ignore both anyway)."""
+    return " ".join(query.lower().split())
+
+
+def _data_fingerprint() -> tuple:
+    """(size, mtime_ns) of every source CSV, so editing the data invalidates cached results."""
+    fingerprint = []
+    for name in _SOURCE_FILES:
+        try:
+            st = (DATA_DIR / name).stat()
+            fingerprint.append((st.st_size, st.st_mtime_ns))
+        except OSError:
+            fingerprint.append(None)
+    return tuple(fingerprint)
+
+
+def _result_key(query: str, project_name: str, output_format: str, fingerprint: tuple) -> tuple:
+    return (RESULT_CACHE_VERSION, query, project_name, output_format, fingerprint)
+
+
 # ============ MAIN ENTRY POINT ============
+_GENERATOR = None
+_GENERATOR_STAT = None
+_GENERATOR_LOCK = threading.Lock()
+
+
+def get_generator() -> DesignSystemGenerator:
+    """Return a shared generator, reloading reasoning rules when the CSV changes."""
+    global _GENERATOR, _GENERATOR_STAT
+    filepath = DATA_DIR / REASONING_FILE
+    try:
+        st = filepath.stat()
+        stat = (st.st_size, st.st_mtime_ns)
+    except OSError:
+        stat = None
+    with _GENERATOR_LOCK:
+        if _GENERATOR is None or stat != _GENERATOR_STAT:
+            _GENERATOR = DesignSystemGenerator()
+            _GENERATOR_STAT = stat
+        return _GENERATOR
+
+
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii") -> str:
     """
     Main entry point for design system generation.
@@ -439,12 +740,56 @@ def generate_design_system(query: str, project_name: str = None, output_format:
     Returns:
         Formatted design system string
     """
-    generator = DesignSystemGenerator()
-    design_system = generator.generate(query, project_name)
+    query = _normalize_query(query)
+    key = _result_key(query, project_name, output_format, _data_fingerprint())
+    with phase("result_cache"):
+        result = _RESULT_CACHE.get(key)
+    if result is not None:
+        count("result_cache_hits")
+    else:
+        result = _format_design_system(get_generator().generate(query, project_name), output_format)
+        _RESULT_CACHE.put(key, result)
+    return result
+
+
+def generate_design_systems(queries: list, project_names: list = None, output_format: str = "ascii") -> list:
+    """
+    Batch entry point: generate design systems for many queries at once.
 
-    if output_format == "markdown":
-        return format_markdown(design_system)
-    return format_ascii_box(design_system)
+    Args:
+        queries: Search queries
+        project_names: Optional project names, one per query
+        output_format: "ascii" (default) or "markdown"
+
+    Returns:
+        Formatted design system strings, in query order
+    """
+    queries = [_normalize_query(query) for query in queries]
+    if project_names is None:
+        project_names = [None] * len(queries)
+    fingerprint = _data_fingerprint()
+    keys = [_result_key(query, project_name, output_format, fingerprint)
+            for query, project_name in zip(queries, project_names)]
+    results = [_RESULT_CACHE.get(key) for key in keys]
+
+    # Generate only the misses, still as one batch
+    misses = [i for i, result in enumerate(results) if result is None]
+    if misses:
+        design_systems = get_generator().generate_many(
+            [queries[i] for i in misses], [project_names[i] for i in misses]
+        )
+        for i, design_system in zip(misses, design_systems):
+            results[i] = _format_design_system(design_system, output_format)
+            _RESULT_CACHE.put(keys[i], results[i])
+    return results
+
+
+def _format_design_system(design_system: dict, output_format: str) -> str:
+    """Render a design system dict in the requested output format."""
+    with phase("format"):
+        if output_format == "markdown":
+            return format_markdown(design_system)
+        return format_ascii_box(design_system)
 
 
 # ============ CLI SUPPORT ============
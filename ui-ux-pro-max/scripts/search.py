@@ -2,22 +2,57 @@
 # -*- coding: utf-8 -*-
 """
 UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
-Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
+Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3] [--page 2]
        python search.py "<query>" --design-system [-p "Project Name"]
+       python search.py --serve [--socket /tmp/ui-ux-pro-max.sock]
+       python search.py "<query>" --profile   (per-phase timings as JSON after the results)
 
-Domains: style, prompt, color, chart, landing, product, ux, typography
-Stacks: html-tailwind, react, nextjs
+Domains: style, prompt, color, chart, landing, product, ux, typography, icons (or "all")
+Stacks: html-tailwind, react, nextjs, ... (or "all")
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system
+import os
+import sys
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_all, search_stack, phase
+
+# One-shot searches run hundreds of times a day: json, the design-system generator
+# and the server modules are imported only on the paths that use them.
+
+
+def _terminal_columns():
+    """shutil.get_terminal_size().columns: $COLUMNS, else the terminal's width, else 80"""
+    try:
+        columns = int(os.environ["COLUMNS"])
+    except (KeyError, ValueError):
+        columns = 0
+    if columns <= 0:
+        try:
+            columns = os.get_terminal_size(sys.__stdout__.fileno()).columns
+        except (AttributeError, ValueError, OSError):
+            columns = 0
+    return columns or 80
+
+
+class _HelpFormatter(argparse.HelpFormatter):
+    """Default help layout; argparse would import shutil (and zlib, bz2, lzma) just for the width"""
+
+    def __init__(self, prog, indent_increment=2, max_help_position=24, width=None):
+        super().__init__(prog, indent_increment, max_help_position, width or _terminal_columns() - 2)
 
 
 def format_output(result):
     """Format results for Claude consumption (token-optimized)"""
     if "error" in result:
         return f"Error: {result['error']}"
+    if "domains" in result:
+        # Best-matching domain first, the rest in configuration order
+        ordered = sorted(result["domains"].values(), key=lambda domain_result: domain_result["domain"] != result["domain"])
+        sections = [format_output(domain_result) for domain_result in ordered if domain_result["count"]]
+        return "\n".join(sections) if sections else f"No results for: {result['query']}"
+    if "stacks" in result:
+        sections = [format_output(stack_result) for stack_result in result["stacks"].values() if stack_result["count"]]
+        return "\n".join(sections) if sections else f"No results for: {result['query']}"
 
     output = []
     if result.get("stack"):
@@ -26,9 +61,13 @@ def format_output(result):
     else:
         output.append(f"## UI Pro Max Search Results")
         output.append(f"**Domain:** {result['domain']} | **Query:** {result['query']}")
-    output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
+    if "total" in result:
+        first = result["offset"] + 1 if result["count"] else result["offset"]
+        output.append(f"**Source:** {result['file']} | **Showing:** {first}-{result['offset'] + result['count']} of {result['total']} results\n")
+    else:
+        output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
 
-    for i, row in enumerate(result['results'], 1):
+    for i, row in enumerate(result['results'], result.get("offset", 0) + 1):
         output.append(f"### Result {i}")
         for key, value in row.items():
             value_str = str(value)
@@ -40,37 +79,224 @@ def format_output(result):
     return "\n".join(output)
 
 
+def run_search(args):
+    """Run the search the CLI arguments ask for; returns (result dict or None, text output)"""
+    # Design system takes priority
+    if args.design_system:
+        from design_system import generate_design_system
+        return None, generate_design_system(args.query, args.project_name, args.format)
+    offset = (args.page - 1) * args.max_results if args.page else None
+    # Stack search
+    if args.stack:
+        result = search_stack(args.query, args.stack, args.max_results, offset)
+    # Domain search
+    elif args.domain == "all":
+        result = search_all(args.query, args.max_results)
+    else:
+        result = search(args.query, args.domain, args.max_results, offset=offset)
+    if args.json:
+        return result, None
+    with phase("format"):
+        return result, format_output(result)
+
+
+# ============ SERVER MODE ============
+def handle_request(request, defaults):
+    """Answer one server request; missing options fall back to the CLI defaults.
+
+    Never raises: a request that breaks the search gets an error response, so
+    one bad client cannot take the long-lived server down.
+    """
+    if not isinstance(request, dict):
+        return {"error": "Request must be a JSON object"}
+    try:
+        if not request.get("profile", defaults.profile):
+            return _answer(request, defaults)
+
+        from core import Profile
+        with Profile() as profile:
+            response = _answer(request, defaults)
+        response["profile"] = profile.to_dict()
+        return response
+    except Exception as exc:
+        response = {"id": request["id"]} if "id" in request else {}
+        response["error"] = f"Request failed: {type(exc).__name__}: {exc}"
+        return response
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _answer(request, defaults):
+    response = {"id": request["id"]} if "id" in request else {}
+    query = request.get("query")
+    if not isinstance(query, str) or not query.strip():
+        response["error"] = "Missing query"
+        return response
+
+    domain = request.get("domain", defaults.domain)
+    stack = request.get("stack", defaults.stack)
+    max_results = request.get("max_results", defaults.max_results)
+    for key, value in (("domain", domain), ("stack", stack)):
+        if value is not None and not isinstance(value, str):
+            response["error"] = f"{key} must be a string"
+            return response
+    if domain is not None and domain != "all" and domain not in CSV_CONFIG:
+        response["error"] = f"Unknown domain: {domain}. Available: {', '.join(CSV_CONFIG)}"
+        return response
+    if not _is_int(max_results) or max_results < 1:
+        response["error"] = "max_results must be a positive integer"
+        return response
+    # Paging: an explicit offset or a next_cursor from the previous page; "page" is 1-based
+    offset, cursor = request.get("offset"), request.get("cursor")
+    page = request.get("page", defaults.page)
+    if page is not None and offset is None:
+        if not _is_int(page) or page < 1:
+            response["error"] = "page must be a positive integer"
+            return response
+        offset = (page - 1) * max_results
+    if offset is not None and (not _is_int(offset) or offset < 0):
+        response["error"] = "offset must be a non-negative integer"
+        return response
+    if cursor is not None and not isinstance(cursor, str):
+        response["error"] = "cursor must be a string"
+        return response
+    if (offset is not None or cursor is not None) and domain == "all" and not stack:
+        response["error"] = "Paging is only available for a single domain"
+        return response
+
+    if request.get("design_system", defaults.design_system):
+        output_format = request.get("format", defaults.format)
+        if not isinstance(output_format, str) or output_format not in ("ascii", "markdown"):
+            response["error"] = f"Unknown format: {output_format}. Available: ascii, markdown"
+            return response
+        project_name = request.get("project_name", defaults.project_name)
+        if project_name is not None and not isinstance(project_name, str):
+            response["error"] = "project_name must be a string"
+            return response
+        from design_system import generate_design_system
+        response["output"] = generate_design_system(query, project_name, output_format)
+    elif stack:
+        response.update(search_stack(query, stack, max_results, offset, cursor))
+    elif domain == "all":
+        response.update(search_all(query, max_results))
+    else:
+        response.update(search(query, domain, max_results, offset=offset, cursor=cursor))
+    return response
+
+
+def _handle_line(line, defaults):
+    """Decode one newline-delimited JSON request and encode its response"""
+    import json
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as exc:
+        response = {"error": f"Invalid JSON: {exc}"}
+    else:
+        response = handle_request(request, defaults)
+    return json.dumps(response, ensure_ascii=False) + "\n"
+
+
+def serve_stdio(defaults):
+    """Serve newline-delimited JSON requests on stdin, one response line per request"""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        sys.stdout.write(_handle_line(line, defaults))
+        sys.stdout.flush()
+
+
+def serve_socket(path, defaults):
+    """Serve newline-delimited JSON requests on a local Unix socket"""
+    import os
+    import signal
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            import json
+            for raw in self.rfile:
+                try:
+                    line = raw.decode("utf-8")
+                except UnicodeDecodeError as exc:
+                    reply = json.dumps({"error": f"Invalid UTF-8: {exc}"}) + "\n"
+                else:
+                    if not line.strip():
+                        continue
+                    reply = _handle_line(line, defaults)
+                self.wfile.write(reply.encode("utf-8"))
+                self.wfile.flush()
+
+    if os.path.exists(path):
+        os.unlink(path)
+    # Let a plain `kill` shut down cleanly and remove the socket file
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with socketserver.ThreadingUnixStreamServer(path, Handler) as server:
+        server.daemon_threads = True
+        print(f"Serving on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+
+
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
-    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
-    parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
+    parser = argparse.ArgumentParser(description="UI Pro Max Search", formatter_class=_HelpFormatter)
+    parser.add_argument("query", nargs="?", help="Search query")
+    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()) + ["all"], help="Search domain (all: every domain in one pass)")
+    parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS + ["all"], help="Stack-specific search (html-tailwind, react, nextjs, ...; all: every stack in one pass)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
+    parser.add_argument("--page", type=int, default=None, help="Show this page of --max-results results (1-based)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+    # Server mode
+    parser.add_argument("--serve", action="store_true", help="Keep indexes warm and answer newline-delimited JSON queries")
+    parser.add_argument("--socket", type=str, default=None, help="Serve on this Unix socket path instead of stdin/stdout")
+    # Diagnostics
+    parser.add_argument("--profile", action="store_true", help="Report per-phase wall/CPU timings, index sizes and candidate counts as JSON")
 
     args = parser.parse_args()
 
-    # Design system takes priority
-    if args.design_system:
-        result = generate_design_system(args.query, args.project_name, args.format)
-        print(result)
-    # Stack search
-    elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.serve:
+        from core import warm_indexes
+        from design_system import get_generator
+        warm_indexes()
+        get_generator()
+        if args.socket:
+            serve_socket(args.socket, args)
         else:
-            print(format_output(result))
-    # Domain search
+            serve_stdio(args)
+        sys.exit(0)
+    if not args.query:
+        parser.error("the following arguments are required: query")
+    if args.page is not None:
+        if args.page < 1:
+            parser.error("--page must be 1 or greater")
+        if args.design_system or args.stack == "all" or (args.domain == "all" and not args.stack):
+            parser.error("--page needs a single domain or stack search")
+
+    if args.profile:
+        from core import Profile
+        with Profile() as profile:
+            result, output = run_search(args)
     else:
-        result = search(args.query, args.domain, args.max_results)
-        if args.json:
+        profile = None
+        result, output = run_search(args)
+
+    if output is None:
+        import json
+        if profile is not None:
+            result = dict(result, profile=profile.to_dict())
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print(output)
+        if profile is not None:
             import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
+            print("\n## Profile")
+            print(json.dumps(profile.to_dict(), indent=2))
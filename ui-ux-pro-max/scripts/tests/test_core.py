@@ -0,0 +1,54 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import core
+
+
+class TestIndexAppend(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        # Merges run on a background thread; let them finish before the directory goes away
+        self.addCleanup(self._join_merges)
+        self.root = Path(tmp.name)
+        patcher = mock.patch.object(core, "CACHE_DIR", self.root / "cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _join_merges():
+        for thread in threading.enumerate():
+            if thread.name == "ui-ux-pro-max-merge":
+                thread.join()
+
+    def _load(self, filepath):
+        return core.load_index(filepath, ["Name", "Keywords"], ["Name"])
+
+    def test_append_to_file_without_trailing_newline_adds_delta(self):
+        filepath = self.root / "styles.csv"
+        filepath.write_bytes(b"Name,Keywords\nFlat,simple clean\nNeon,glow dark")
+        self.assertEqual(len(self._load(filepath)), 2)
+
+        with open(filepath, "ab") as f:
+            f.write(b"\nGlass,frosted blur\n")
+        index = self._load(filepath)
+        self.assertTrue(index.bm25.deltas)
+        self.assertEqual(index.row(2), {"Name": "Glass"})
+
+    def test_append_inside_open_quoted_field_rebuilds(self):
+        filepath = self.root / "styles.csv"
+        filepath.write_bytes(b'Name,Keywords\nFlat,simple clean\nNeon,"glow')
+        self.assertEqual(len(self._load(filepath)), 2)
+
+        with open(filepath, "ab") as f:
+            f.write(b'\ndark"\nGlass,frosted blur\n')
+        index = self._load(filepath)
+        self.assertFalse(index.bm25.deltas)
+        self.assertEqual([index.row(i)["Name"] for i in range(len(index))], ["Flat", "Neon", "Glass"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import benchmark
+
+SEARCH_PY = Path(__file__).resolve().parent.parent / "search.py"
+# Only needed to build an index, render JSON, lay out help or generate a design system
+HEAVY_MODULES = {"csv", "json", "pickle", "shutil", "design_system"}
+
+
+class TestStartup(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.env = {
+            "UI_UX_PRO_MAX_CACHE_DIR": str(Path(tmp.name) / "cache"),
+            "UI_UX_PRO_MAX_BUNDLE": str(Path(tmp.name) / "missing.bundle"),
+        }
+
+    def test_cached_domain_search_skips_heavy_imports(self):
+        command = [sys.executable, "-X", "importtime", str(SEARCH_PY), "button", "--domain", "style"]
+        env = dict(os.environ, **self.env)
+        # The first run builds and caches the index
+        subprocess.run(command, env=env, check=True, capture_output=True)
+        completed = subprocess.run(command, env=env, check=True, capture_output=True, text=True)
+
+        imported = set(re.findall(r"^import time:.*\|\s*(\S+)$", completed.stderr, re.MULTILINE))
+        self.assertIn("core", imported)
+        self.assertEqual(imported & HEAVY_MODULES, set())
+
+    def test_domain_search_within_startup_budget(self):
+        with mock.patch.dict(os.environ, self.env):
+            report = benchmark.measure_startup()
+        self.assertTrue(report["within_budget"], msg=benchmark.summarize_startup(report))
+
+
+if __name__ == "__main__":
+    unittest.main()